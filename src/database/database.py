@@ -15,13 +15,35 @@ from sqlalchemy import (
     VARCHAR,
 )
 from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy.orm import (
+    declarative_base,
+    relationship,
+    scoped_session,
+    sessionmaker,
+)
 from sqlalchemy.sql import func
 
 DATABASE_URL = "duckdb:///md:Medium-Final"  # Persistent storage
+DB_POOL_SIZE = 10  # Enough for the writer and producer threads plus metrics
+DB_MAX_OVERFLOW = 5
+DB_QUERY_CACHE_SIZE = 1200  # Compiled statements kept per engine (default 500)
 Base = declarative_base()
-engine = create_engine(DATABASE_URL, echo=False)
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# One session per long-lived database thread: the article and URL status
+# writers and the task producer. Browser workers never open one. Each thread
+# calls ScopedSession.remove() when it stops. Objects stay loaded after a
+# commit, so reading an id afterwards does not cost a refresh query.
+ScopedSession = scoped_session(
+    sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+)
 
 
 class Sitemap(Base):
@@ -1,14 +1,20 @@
 import sys
-from datetime import datetime
+import time
+from collections import deque
 from threading import Lock
-from typing import List
+from typing import Deque
 
 from rich.console import Console
 
 # Create console for logging
 console = Console()
 log_lock = Lock()
-log_messages: List[str] = []
+# Only the latest messages are shown, so older ones are dropped on append
+MAX_LOG_MESSAGES = 30
+log_messages: Deque[str] = deque(maxlen=MAX_LOG_MESSAGES)
+
+# Incremented on every stored message so renderers can tell when to redraw
+log_version = 0
 
 # Global log level
 LOG_LEVEL = "info"
@@ -22,6 +28,17 @@ LOG_LEVELS = {
     "debug": 4,  # Detailed debugging information
 }
 
+# Verbosity of LOG_LEVEL, so filtering is a single int comparison
+_log_threshold = LOG_LEVELS[LOG_LEVEL]
+
+LOG_PREFIXES = {
+    "error": "[red][ERROR][/]",
+    "warning": "[yellow][WARN][/]",
+    "success": "[green][SUCCESS][/]",
+    "info": "[blue][INFO][/]",
+    "debug": "[dim cyan][DEBUG][/]",
+}
+
 
 def set_log_level(level: str) -> str:
     """
@@ -40,7 +57,7 @@ def set_log_level(level: str) -> str:
     Returns:
         str: Status message about the log level change
     """
-    global LOG_LEVEL
+    global LOG_LEVEL, _log_threshold
 
     status_message = ""
     if level in LOG_LEVELS:
@@ -50,6 +67,7 @@ def set_log_level(level: str) -> str:
         LOG_LEVEL = "info"
         status_message = f"Invalid log level: {level}. Using 'info'."
 
+    _log_threshold = LOG_LEVELS[LOG_LEVEL]
     return status_message
 
 
@@ -63,6 +81,16 @@ def get_log_level() -> str:
     return LOG_LEVEL
 
 
+def get_log_version() -> int:
+    """
+    Get the number of log messages stored so far.
+
+    Returns:
+        int: Version that changes whenever log_messages changes
+    """
+    return log_version
+
+
 def log_message(message: str, level: str = "info") -> None:
     """
     Add a log message to the display if its level is at or above the global log level.
@@ -71,25 +99,20 @@ def log_message(message: str, level: str = "info") -> None:
         message (str): Message to log
         level (str): Log level (error, warning, success, info, debug)
     """
-    global LOG_LEVEL
+    global log_version
 
-    # Check if this message should be logged based on the current log level
-    if level not in LOG_LEVELS:
+    # Filter before formatting or taking the lock, so skipped messages are cheap
+    verbosity = LOG_LEVELS.get(level)
+    if verbosity is None:
         level = "info"
+        verbosity = LOG_LEVELS[level]
 
-    if LOG_LEVELS[level] > LOG_LEVELS[LOG_LEVEL]:
+    if verbosity > _log_threshold:
         return  # Skip messages that are too verbose for the current log level
 
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    prefixes = {
-        "error": "[red][ERROR][/]",
-        "warning": "[yellow][WARN][/]",
-        "success": "[green][SUCCESS][/]",
-        "info": "[blue][INFO][/]",
-        "debug": "[dim cyan][DEBUG][/]",
-    }
-    prefix = prefixes.get(level, prefixes["info"])
+    timestamp = time.strftime("%H:%M:%S")
+    prefix = LOG_PREFIXES[level]
 
     with log_lock:
         log_messages.append(f"[dim]{timestamp}[/] {prefix} {message}")
-        log_messages[:] = log_messages[-30:]
+        log_version += 1
@@ -1,31 +1,196 @@
 import json
+import random
 import re
 import signal
 import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from queue import Empty, Queue
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from html_to_markdown import convert_to_markdown
 from playwright.sync_api import Page
-from sqlalchemy import and_, func, or_
+from sqlalchemy import Select, and_, func, insert, or_, select, update
 from sqlalchemy.orm import Session
 
-from database.database import URL, Author, Comment, MediumArticle, Sitemap
+# orjson parses the JSON-LD metadata several times faster when installed
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+from database.database import (
+    URL,
+    Author,
+    Comment,
+    MediumArticle,
+    ScopedSession,
+    Sitemap,
+)
 from scraper.log_utils import log_message, set_log_level
 from scraper.playwright_helpers import (
+    READ_TIME_SELECTOR,
     click_see_all_responses,
     close_overlay,
     scroll_to_load_comments,
     verify_its_an_article,
 )
 
+# Selectors for the per-article statistics
+CLAPS_SELECTOR = "div.pw-multi-vote-count button"
+PAID_ARTICLE_SELECTOR = "article.meteredContent"
+ARTICLE_STATS_SELECTORS = {
+    "readTime": READ_TIME_SELECTOR,
+    "claps": CLAPS_SELECTOR,
+    "paid": PAID_ARTICLE_SELECTOR,
+}
+
+# Selectors for the article content, defined once and shared by the
+# evaluate scripts and the per-field helpers
+METADATA_SELECTOR = 'script[type="application/ld+json"]'
+TAG_SELECTOR = 'a[href*="/tag/"]'
+ARTICLE_SELECTOR = "article"
+COMMENT_XPATH = "//pre/ancestor::div[5]"
+ARTICLE_CONTENT_SELECTORS = {
+    **ARTICLE_STATS_SELECTORS,
+    "metadata": METADATA_SELECTOR,
+    "tags": TAG_SELECTOR,
+    "article": ARTICLE_SELECTOR,
+}
+
+# Metadata fields and their key path in the JSON-LD document
+_JSONLD_FIELDS = (
+    ("type", ("@type",)),
+    ("author_url", ("author", "url")),
+    ("date_created", ("dateCreated",)),
+    ("date_modified", ("dateModified",)),
+    ("date_published", ("datePublished",)),
+    ("description", ("description",)),
+    ("publisher_type", ("publisher", "@type")),
+    ("title", ("headline",)),
+)
+
+# The author's @handle inside their profile URL
+AUTHOR_USERNAME_RE = re.compile(r"@[^/]+")
+
+# Rows fetched per round-trip when streaming URLs to the workers
+URL_FETCH_BATCH_SIZE = 500
+
+# Largest clap count the SmallInteger comments.claps column can hold
+COMMENT_CLAPS_MAX = 32767
+
+# Reads the JSON-LD metadata, tags, article HTML and statistics in one
+# evaluate call
+ARTICLE_CONTENT_JS = """
+(selectors) => {
+    const text = (selector) => {
+        const el = document.querySelector(selector);
+        return el ? el.innerText : null;
+    };
+    const script = document.querySelector(selectors.metadata);
+    const article = document.querySelector(selectors.article);
+    const responses = Array.from(document.querySelectorAll("h2")).find(
+        (h2) => h2.innerText.toLowerCase().includes("responses")
+    );
+    return {
+        metadata: script ? script.textContent : null,
+        tags: Array.from(
+            document.querySelectorAll(selectors.tags), (tag) => tag.innerText.trim()
+        ).filter(Boolean),
+        articleHtml: article ? article.innerHTML : null,
+        readTime: text(selectors.readTime),
+        claps: text(selectors.claps),
+        responses: responses ? responses.innerText : null,
+        isPaid: document.querySelector(selectors.paid) !== null,
+    };
+}
+"""
+
+# Reads every potential comment element in one evaluate call. Answers to
+# comments are recognised by the border of their grandparent.
+COMMENTS_JS = """
+(xpath) => {
+    const snapshot = document.evaluate(
+        xpath, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    const textOf = (el) => {
+        try {
+            // Navigate through the DOM structure more cautiously
+            const firstChild = el.firstElementChild;
+            if (!firstChild) return null;
+
+            const firstInnerChild = firstChild.firstElementChild;
+            if (!firstInnerChild) return null;
+
+            const secondInnerChild = firstInnerChild.firstElementChild;
+            if (!secondInnerChild) return null;
+
+            const lastChild = secondInnerChild.lastElementChild;
+            if (!lastChild) return null;
+
+            const prevSibling = lastChild.previousElementSibling;
+            if (!prevSibling) return null;
+
+            return prevSibling.innerText;
+        } catch (e) {
+            // Try alternative method to find text
+            const paragraphs = el.querySelectorAll('p:not([id^="embedded-quote"])');
+            if (paragraphs.length) {
+                return Array.from(paragraphs).map(p => p.innerText).join('\\n');
+            }
+            return null;
+        }
+    };
+    const elements = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        const el = snapshot.snapshotItem(i);
+        let isAnswer = null;
+        try {
+            const border = window.getComputedStyle(el.parentElement.parentElement).borderLeft;
+            isAnswer = border === "3px solid rgb(242, 242, 242)";
+        } catch (e) {}
+        const author = el.querySelector("a[href*='/@']");
+        const firstLink = el.querySelector("a");
+        const claps = el.querySelector("div.pw-multi-vote-count");
+        elements.push({
+            isAnswer: isAnswer,
+            referencesArticle: el.querySelector("p[id^='embedded-quote']") !== null,
+            authorUrl: author ? author.getAttribute("href") : null,
+            firstLinkUrl: firstLink ? firstLink.getAttribute("href") : null,
+            text: textOf(el),
+            claps: claps ? claps.innerText : null,
+        });
+    }
+    return elements;
+}
+"""
+
 # Create a lock for database operations
 db_persist_lock = threading.Lock()
 
+# Event the installed signal handlers currently set
+_signal_shutdown_event: Optional[threading.Event] = None
+
+# Lists of URL status updates waiting for the status writer thread. They are
+# written in batches of up to URL_STATUS_BATCH_SIZE, collected for at most
+# URL_STATUS_FLUSH_SECONDS.
+URL_STATUS_BATCH_SIZE = 200
+URL_STATUS_FLUSH_SECONDS = 0.25
+url_status_queue: Queue = Queue()
+
+# Each worker buffers its updates in a thread-local list and hands them to
+# url_status_queue as one item once the buffer is full or old enough.
+URL_STATUS_BUFFER_SIZE = 100
+URL_STATUS_BUFFER_SECONDS = 0.5
+_status_buffer = threading.local()
+
 
 def fetch_random_urls(
     session: Session, count: int, with_login: bool
-) -> List[Tuple[int, str]]:
+) -> Iterator[Tuple[int, str]]:
     """
     Fetch random URLs from the database that match the specified criteria.
 
@@ -38,12 +203,13 @@ def fetch_random_urls(
         count (int): Number of URLs to fetch.
         with_login (bool): Only include premium URLs that have not been crawled yet with login.
     Returns:
-        List[Tuple[int, str]]: List of tuples containing URL ID and URL.
+        Iterator[Tuple[int, str]]: URL ID and URL pairs, streamed in batches
+            while the session stays open.
     """
 
     if not with_login:
         query = (
-            session.query(URL.id, URL.url)
+            select(URL.id, URL.url)
             .join(URL.sitemap)
             .filter(
                 Sitemap.sitemap_url.like("%/posts/%"),
@@ -51,27 +217,54 @@ def fetch_random_urls(
             .filter(
                 URL.last_crawled.is_(None),
             )
-            .limit(count)
         )
     else:
         query = (
-            session.query(URL.id, URL.url)
+            select(URL.id, URL.url)
             .join(URL.sitemap)
             .join(URL.article)
             .filter(Sitemap.sitemap_url.like("%/posts/%"))
             .filter(MediumArticle.is_free.is_(False))
             .filter(URL.with_login.is_(False))
-            .limit(count)
         )
 
     log_message(f"Fetching {count} random URLs from database", "debug")
 
-    return query.all()
+    return sample_from_random_id(session, query, count)
+
+
+def sample_from_random_id(
+    session: Session, query: Select, count: Optional[int]
+) -> Iterator[Tuple[int, str]]:
+    """
+    Stream up to count rows of a URL query, starting at a random URL id and
+    wrapping around to the lower ids. This samples without ORDER BY random(),
+    which would sort the whole table.
+    Args:
+        session (Session): SQLAlchemy session object.
+        query (Select): Select of URL.id and URL.url without a limit.
+        count (Optional[int]): Maximum number of rows, or None for all.
+    Returns:
+        Iterator[Tuple[int, str]]: URL ID and URL pairs.
+    """
+    max_id = session.execute(select(func.max(URL.id))).scalar() or 0
+    start_id = random.randint(0, max_id)
+
+    fetched = 0
+    for part in (query.where(URL.id >= start_id), query.where(URL.id < start_id)):
+        if count is not None:
+            if fetched >= count:
+                return
+            part = part.limit(count - fetched)
+
+        for row in session.execute(part).yield_per(URL_FETCH_BATCH_SIZE):
+            fetched += 1
+            yield row
 
 
 def fetch_failed_urls(
     session: Session, count: Optional[int], with_login: bool
-) -> List[Tuple[int, str]]:
+) -> Iterator[Tuple[int, str]]:
     """
     Fetch previously failed URLs for retry.
 
@@ -80,12 +273,13 @@ def fetch_failed_urls(
         count (Optional[int]): Max number of URLs to fetch.
         with_login (bool): Retry failures from login or non-login runs.
     Returns:
-        List[Tuple[int, str]]: URL ID and URL pairs.
+        Iterator[Tuple[int, str]]: URL ID and URL pairs, streamed in batches
+            while the session stays open.
     """
 
     if not with_login:
         query = (
-            session.query(URL.id, URL.url)
+            select(URL.id, URL.url)
             .join(URL.sitemap)
             .filter(Sitemap.sitemap_url.like("%/posts/%"))
             .filter(URL.crawl_status.isnot(None))
@@ -95,7 +289,7 @@ def fetch_failed_urls(
         )
     else:
         query = (
-            session.query(URL.id, URL.url)
+            select(URL.id, URL.url)
             .join(URL.sitemap)
             .join(URL.article)
             .filter(Sitemap.sitemap_url.like("%/posts/%"))
@@ -107,57 +301,155 @@ def fetch_failed_urls(
         )
 
     log_message(f"Fetching {count or 'all'} failed URLs for retry", "info")
-    return query.all()
+    return session.execute(query).yield_per(URL_FETCH_BATCH_SIZE)
 
 
-def update_url_status(
-    session: Session,
+def queue_url_status(
     url_id: int,
     success: str,
     error: Optional[str] = None,
     with_login: bool = False,
 ) -> None:
     """
-    Update the URL status in the database.
+    Queue a URL status update for the status writer thread.
     Args:
-        session (Session): SQLAlchemy session object.
         url_id (int): ID of the URL to update.
-        success (bool): Whether the crawl was successful or not.
+        success (str): Crawl status to store.
         error (Optional[str]): Optional error message if the crawl failed.
         with_login (bool): Whether the URL was processed with login.
     """
+    buffer = getattr(_status_buffer, "updates", None)
+    if buffer is None:
+        buffer = _status_buffer.updates = []
+        _status_buffer.flushed_at = time.monotonic()
 
-    try:
-        url = session.query(URL).filter(URL.id == url_id).first()
-        if url:
-            url.last_crawled = datetime.now()
-            url.crawl_status = success
-            if error:
-                url.crawl_failure_reason = error
-            url.with_login = with_login
-            session.commit()
-            log_message(
-                f"Updated URL {url_id} status: {success}, with_login: {with_login}",
-                "debug",
+    buffer.append((url_id, success, error, with_login))
+    if (
+        len(buffer) >= URL_STATUS_BUFFER_SIZE
+        or time.monotonic() - _status_buffer.flushed_at > URL_STATUS_BUFFER_SECONDS
+    ):
+        flush_url_status_buffer()
+
+
+def flush_url_status_buffer() -> None:
+    """
+    Hand the current thread's buffered URL status updates to the status writer.
+    Workers call this before they exit so no update is left behind.
+    """
+    buffer = getattr(_status_buffer, "updates", None)
+    if buffer:
+        url_status_queue.put(buffer)
+    _status_buffer.updates = []
+    _status_buffer.flushed_at = time.monotonic()
+
+
+def flush_url_statuses(
+    session: Session, updates: List[Tuple[int, str, Optional[str], bool]]
+) -> None:
+    """
+    Write a batch of URL status updates. Updates without an error share one
+    UPDATE per status, failures with their individual messages are sent as
+    a single executemany. If the batch fails, each status group and each
+    failure is retried in its own transaction.
+    Args:
+        session (Session): SQLAlchemy session object.
+        updates (List[Tuple[int, str, Optional[str], bool]]): Queued updates as
+            (url_id, success, error, with_login).
+    """
+    now = datetime.now()
+    groups: Dict[Tuple[str, bool], List[int]] = {}
+    failures: List[Dict[str, Any]] = []
+    for url_id, success, error, with_login in updates:
+        if error:
+            failures.append(
+                {
+                    "id": url_id,
+                    "last_crawled": now,
+                    "crawl_status": success,
+                    "crawl_failure_reason": error,
+                    "with_login": with_login,
+                }
             )
+        else:
+            groups.setdefault((success, with_login), []).append(url_id)
+
+    group_statements = [
+        update(URL)
+        .where(URL.id.in_(url_ids))
+        .values(last_crawled=now, crawl_status=success, with_login=with_login)
+        for (success, with_login), url_ids in groups.items()
+    ]
+
+    try:
+        for statement in group_statements:
+            session.execute(statement)
+        if failures:
+            # ORM bulk UPDATE by primary key
+            session.execute(update(URL), failures)
+        session.commit()
+        log_message(f"Updated the status of {len(updates)} URLs", "debug")
+        return
     except Exception as e:
         session.rollback()
-        log_message(f"DB error for URL {url_id}: {e}", "error")
+        log_message(
+            f"DB error updating {len(updates)} URL statuses, retrying one by one: {e}",
+            "warning",
+        )
+
+    # Otherwise the dropped URLs would stay uncrawled and be scraped again
+    retries = [(statement, None) for statement in group_statements]
+    retries += [(update(URL), [failure]) for failure in failures]
+    for statement, params in retries:
+        try:
+            session.execute(statement, params)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            log_message(f"DB error updating URL statuses: {e}", "error")
 
 
-def extract_text(page: Page) -> str:
+def url_status_writer(session_factory: callable, stop: threading.Event) -> None:
     """
-    Extract text from the article page.
+    Drain the URL status queue in batches until stop is set and it is empty.
     Args:
-        page (Page): Playwright Page object.
+        session_factory (callable): Function to create a session instance.
+        stop (threading.Event): Event to signal that no more updates will come.
+    """
+    try:
+        with session_factory() as session:
+            while not (stop.is_set() and url_status_queue.empty()):
+                try:
+                    batch = list(url_status_queue.get(timeout=URL_STATUS_FLUSH_SECONDS))
+                except Empty:
+                    continue
+
+                deadline = time.monotonic() + URL_STATUS_FLUSH_SECONDS
+                while len(batch) < URL_STATUS_BATCH_SIZE:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.extend(url_status_queue.get(timeout=remaining))
+                    except Empty:
+                        break
+
+                flush_url_statuses(session, batch)
+    finally:
+        ScopedSession.remove()
+
+
+def article_html_to_text(article_html: Optional[str]) -> str:
+    """
+    Convert the inner HTML of the article element to markdown text.
+    Args:
+        article_html (Optional[str]): Inner HTML of the article, if found.
     Returns:
         str: Extracted text from the article.
     """
-    article = page.query_selector("article")
-    if not article:
+    if not article_html:
         return ""
 
-    return convert_to_markdown(article.inner_html()).split("Share", 1)[-1].strip()
+    return convert_to_markdown(article_html).split("Share", 1)[-1].strip()
 
 
 def count_images(extracted_text: str) -> int:
@@ -181,109 +473,49 @@ def extract_comments(page: Page) -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: List of dictionaries containing comment data.
     """
     comments = []
-    total_elements = 0
     filtered_elements = 0
 
-    # Get all potential comment elements
-    elements = page.locator("xpath=//pre/ancestor::div[5]").all()
+    # Read all potential comment elements in one round-trip to the browser
+    try:
+        elements = page.evaluate(COMMENTS_JS, COMMENT_XPATH)
+    except Exception as e:
+        log_message(f"Error extracting comments: {e}", "debug")
+        return comments
     log_message(f"Found {len(elements)} potential comment elements", "debug")
 
     for el in elements:
-        total_elements += 1
-
         # filter out answer comments based on border
-        try:
-            border_left = el.evaluate(
-                "(el) => window.getComputedStyle(el.parentElement.parentElement).borderLeft"
-            )
-            if border_left == "3px solid rgb(242, 242, 242)":
-                log_message(
-                    f"Filtered answer comment with border: {border_left}", "debug"
-                )
-                filtered_elements += 1
-                continue
-        except Exception as e:
-            log_message(f"Error checking comment border: {e}", "debug")
+        if el["isAnswer"]:
+            log_message("Filtered answer comment by its border", "debug")
+            filtered_elements += 1
+            continue
+        if el["isAnswer"] is None:
+            log_message("Could not check comment border", "debug")
             continue
 
         comment = {
-            "references_article": el.locator("p[id^='embedded-quote']").count() > 0,
+            "references_article": el["referencesArticle"],
             "username": None,
             "user_url": None,
-            "text": None,
-            "claps": None,
+            "text": el["text"] or None,
+            "claps": 0,
         }
 
         # Extract author information
+        if author_url := el["authorUrl"]:
+            # Extract username from URL (format: /@username or /@username?)
+            username_match = re.search(r"/@([^/?]+)", author_url)
+            if username_match:
+                comment["username"] = f"{username_match.group(1)}"
+                comment["user_url"] = author_url.split("?")[0]
+        elif "medium.com/" in (el["firstLinkUrl"] or ""):
+            comment["user_url"] = el["firstLinkUrl"].split("?")[0]
+
+        # Extract claps
         try:
-            if authors := el.locator("a[href*='/@']").all():
-                author = authors[0]
-                author_url = author.get_attribute("href")
-                if author_url:
-                    # Extract username from URL (format: /@username or /@username?)
-                    username_match = re.search(r"/@([^/?]+)", author_url)
-                    if username_match:
-                        comment["username"] = f"{username_match.group(1)}"
-                        comment["user_url"] = author_url.split("?")[0]
-            else:
-                user_url_element = el.locator("a").first
-                if user_url_element and "medium.com/" in (
-                    user_url_element.get_attribute("href") or ""
-                ):
-                    comment["user_url"] = user_url_element.get_attribute("href").split(
-                        "?"
-                    )[0]
-        except Exception as e:
-            log_message(f"Error extracting comment author: {e}", "debug")
-
-        # Extract comment text safely
-        try:
-            # Try a safer approach to get the comment text
-            comment_text = el.evaluate(
-                """
-            (el) => {
-                try {
-                    // Navigate through the DOM structure more cautiously
-                    const firstChild = el.firstElementChild;
-                    if (!firstChild) return null;
-                    
-                    const firstInnerChild = firstChild.firstElementChild;
-                    if (!firstInnerChild) return null;
-                    
-                    const secondInnerChild = firstInnerChild.firstElementChild;
-                    if (!secondInnerChild) return null;
-                    
-                    const lastChild = secondInnerChild.lastElementChild;
-                    if (!lastChild) return null;
-                    
-                    const prevSibling = lastChild.previousElementSibling;
-                    if (!prevSibling) return null;
-                    
-                    return prevSibling.innerText;
-                } catch (e) {
-                    // Try alternative method to find text
-                    const paragraphs = el.querySelectorAll('p:not([id^="embedded-quote"])');
-                    if (paragraphs.length) {
-                        return Array.from(paragraphs).map(p => p.innerText).join('\\n');
-                    }
-                    return null;
-                }
-            }
-            """
-            )
-
-            if comment_text:
-                comment["text"] = comment_text
-
-            # Extract claps
-            if claps := el.locator("div.pw-multi-vote-count").first:
-                try:
-                    comment["claps"] = int(claps.inner_text(timeout=500)) or 0
-                except Exception as e:
-                    comment["claps"] = 0
-                    log_message(f"Failed to parse claps: {e}", "debug")
-        except Exception as e:
-            log_message(f"Error extracting comment text: {e}", "debug")
+            comment["claps"] = int(el["claps"]) or 0
+        except (TypeError, ValueError) as e:
+            log_message(f"Failed to parse claps: {e}", "debug")
 
         if not comment["text"]:
             log_message("Skipping comment with no text", "debug")
@@ -293,7 +525,7 @@ def extract_comments(page: Page) -> List[Dict[str, Any]]:
         comments.append(comment)
 
     log_message(
-        f"Found {total_elements} total elements, filtered {filtered_elements}, kept {len(comments)} comments",
+        f"Found {len(elements)} total elements, filtered {filtered_elements}, kept {len(comments)} comments",
         "debug",
     )
     return comments
@@ -324,6 +556,27 @@ def extract_recommendation_urls(page: Page) -> List[str]:
     return urls
 
 
+def extract_article_content(
+    page: Page,
+) -> Tuple[Dict[str, Any], List[str], str, Dict[str, Any]]:
+    """
+    Extract metadata, tags, text and statistics in a single round-trip to the
+    browser.
+    Args:
+        page (Page): Playwright Page object.
+    Returns:
+        Tuple[Dict[str, Any], List[str], str, Dict[str, Any]]: Metadata, tags,
+            article text and statistics.
+    """
+    raw = page.evaluate(ARTICLE_CONTENT_JS, ARTICLE_CONTENT_SELECTORS)
+    return (
+        parse_metadata(raw["metadata"]),
+        raw["tags"],
+        article_html_to_text(raw["articleHtml"]),
+        parse_article_stats(raw),
+    )
+
+
 def extract_tags(page: Page) -> List[str]:
     """
     Extract tags from an article page.
@@ -335,7 +588,7 @@ def extract_tags(page: Page) -> List[str]:
     """
     tags = []
     try:
-        for tag in page.query_selector_all('a[href*="/tag/"]') or []:
+        for tag in page.query_selector_all(TAG_SELECTOR) or []:
             try:
                 if tag_text := tag.inner_text().strip():
                     tags.append(tag_text)
@@ -399,149 +652,181 @@ def get_or_create_author(
     return author
 
 
-def get_read_time(page: Page) -> Optional[int]:
+def parse_read_time(read_time_text: Optional[str]) -> Optional[int]:
     """
-    Get the read time from the article page.
+    Parse the read time label of an article.
     Args:
-        page (Page): Playwright Page object.
+        read_time_text (Optional[str]): Text like "5 min read".
     Returns:
         Optional[int]: Read time in minutes, or None if not found.
     """
     try:
-        read_time = page.query_selector("span[data-testid='storyReadTime']")
-        if read_time:
-            return int(read_time.inner_text().split()[0])
-    except Exception as e:
+        if read_time_text:
+            return int(read_time_text.split()[0])
+    except (IndexError, ValueError) as e:
         log_message(f"Error getting read time: {e}", "debug")
     return None
 
 
-def get_claps(page: Page) -> Optional[int]:
+def parse_claps(claps_text: Optional[str]) -> Optional[int]:
     """
-    Get the number of claps from the article page.
+    Parse the clap count of an article.
     Args:
-        page (Page): Playwright Page object.
+        claps_text (Optional[str]): Text like "1.2K" or "350".
     Returns:
         Optional[int]: Number of claps, or None if not found.
     """
-    if claps_element := page.query_selector("div.pw-multi-vote-count button"):
-        try:
-            claps_text = claps_element.inner_text()
-            if "K" in claps_text:
-                return int(float(claps_text.replace("K", "").strip()) * 1000)
-            elif "M" in claps_text:
-                return int(float(claps_text.replace("M", "").strip()) * 1000000)
-            else:
-                return int(claps_text.replace(",", "").strip())
-        except ValueError:
-            log_message("Failed to convert claps text to integer", "debug")
-            return None
+    if not claps_text:
+        return None
+    try:
+        if "K" in claps_text:
+            return int(float(claps_text.replace("K", "").strip()) * 1000)
+        elif "M" in claps_text:
+            return int(float(claps_text.replace("M", "").strip()) * 1000000)
+        else:
+            return int(claps_text.replace(",", "").strip())
+    except ValueError:
+        log_message("Failed to convert claps text to integer", "debug")
+        return None
 
 
-def get_comments_count(page: Page) -> Optional[int]:
+def parse_comments_count(comments_text: Optional[str]) -> Optional[int]:
     """
-    Get the number of comments from the article page.
+    Parse the responses header of an article.
     Args:
-        page (Page): Playwright Page object.
+        comments_text (Optional[str]): Text like "Responses (12)".
     Returns:
         Optional[int]: Number of comments, or None if not found.
     """
-    if comments_element := page.query_selector("h2:has-text('Responses')"):
-        try:
-            comments_text = comments_element.inner_text()
-            if comments_text == "No responses yet":
-                return None
-            comments_count = re.search(r"\d+", comments_text).group(0)
-            return int(comments_count)
-        except (AttributeError, ValueError):
-            log_message("Failed to extract comments count", "debug")
-            return None
-        except ValueError:
-            log_message("Failed to convert comments text to integer", "debug")
-            return None
+    if not comments_text or comments_text == "No responses yet":
+        return None
+    try:
+        return int(re.search(r"\d+", comments_text).group(0))
+    except (AttributeError, ValueError):
+        log_message("Failed to extract comments count", "debug")
+        return None
 
 
-def is_paid_article(page: Page) -> bool:
+def parse_article_stats(raw: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Check if the article is a paid article.
+    Convert the raw statistics read from the page into typed values.
     Args:
-        page (Page): Playwright Page object.
+        raw (Dict[str, Any]): Raw readTime, claps, responses and isPaid values.
     Returns:
-        bool: True if the article is paid, False otherwise.
+        Dict[str, Any]: Dictionary with read_time, claps, comments_count and is_free.
     """
-    try:
-        return page.query_selector("article.meteredContent") is not None
-    except Exception as e:
-        log_message(f"Error checking paid article: {e}", "debug")
-        return False
+    return {
+        "read_time": parse_read_time(raw.get("readTime")),
+        "claps": parse_claps(raw.get("claps")),
+        "comments_count": parse_comments_count(raw.get("responses")),
+        "is_free": not raw.get("isPaid", False),
+    }
 
 
-def extract_metadata(page: Page) -> Dict[str, Any]:
+def _nested(data: Dict[str, Any], path: Tuple[str, ...]) -> Any:
     """
-    Extract metadata from the article page.
+    Follow a key path through nested dictionaries.
     Args:
-        page (Page): Playwright Page object.
+        data (Dict[str, Any]): The outer dictionary.
+        path (Tuple[str, ...]): Keys to follow.
     Returns:
-        Dict[str, Any]: Dictionary containing metadata.
+        Any: The value at the end of the path, or None if a key is missing.
     """
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
 
-    if script := page.query_selector('script[type="application/ld+json"]'):
-        json_data = json.loads(script.inner_text())
-        article_data = {
-            "type": json_data.get("@type"),
-            "username": (
-                re.search(r"@[^/]+", json_data.get("author", {}).get("url", "")).group(
-                    0
-                )
-                if re.search(r"@[^/]+", json_data.get("author", {}).get("url", ""))
-                else None
-            ),
-            "author_url": json_data.get("author", {}).get("url"),
-            "date_created": json_data.get("dateCreated"),
-            "date_modified": json_data.get("dateModified"),
-            "date_published": json_data.get("datePublished"),
-            "description": json_data.get("description"),
-            "publisher_type": json_data.get("publisher", {}).get("@type"),
-            "title": json_data.get("headline"),
-        }
-    else:
+
+def parse_metadata(json_text: Optional[str]) -> Dict[str, Any]:
+    """
+    Parse the JSON-LD metadata of an article.
+    Args:
+        json_text (Optional[str]): Content of the ld+json script, if found.
+    Returns:
+        Dict[str, Any]: Dictionary containing metadata.
+    """
+    if not json_text:
         log_message("No metadata script found on the page.", "warning")
         return {}
 
+    json_data = json_loads(json_text)
+    article_data = {field: _nested(json_data, path) for field, path in _JSONLD_FIELDS}
+    username = AUTHOR_USERNAME_RE.search(article_data["author_url"] or "")
+    article_data["username"] = username.group(0) if username else None
+
     return article_data
 
 
-def persist_article_data(
-    session: Session,
-    url_id: int,
-    page: Page,
-    with_login: bool,
-    insert_recc: bool = False,
-) -> bool:
+def scrape_article_data(page: Page, with_login: bool) -> Dict[str, Any]:
+    """
+    Extract everything that is stored for the article on the page. Does not
+    touch the database, so no connection is held during browser work.
+    Args:
+        page (Page): Playwright Page object.
+        with_login (bool): Whether the page was loaded with login.
+    Returns:
+        Dict[str, Any]: Article data for store_article_data.
+    """
 
-    page.wait_for_load_state("networkidle")
+    # The JSON-LD metadata is part of the server-rendered HTML, so waiting for
+    # it is enough; "networkidle" never settles on Medium's analytics beacons.
+    page.wait_for_selector(METADATA_SELECTOR, state="attached", timeout=5000)
 
     close_overlay(page)
 
-    metadata = extract_metadata(page)
-    tags = extract_tags(page)
+    metadata, tags, full_text, stats = extract_article_content(page)
 
     assert metadata.get("title"), "JSON metadata is empty"
 
-    full_text = extract_text(page)
-    claps = get_claps(page) or 0
-    comments_count = get_comments_count(page) or 0
-    is_free = not is_paid_article(page)
-    read_time = get_read_time(page)
-    recc = extract_recommendation_urls(page)
-    num_images = count_images(full_text)
-
+    comments = []
     if not with_login:
         click_see_all_responses(page)
+        # The scroll only returns once the comment list has stopped changing
         scroll_to_load_comments(page)
-        page.wait_for_timeout(500)
         comments = extract_comments(page)
 
+    return {
+        "metadata": metadata,
+        "tags": tags,
+        "full_text": full_text,
+        "num_images": count_images(full_text),
+        "claps": stats["claps"] or 0,
+        "comments_count": stats["comments_count"] or 0,
+        "is_free": stats["is_free"],
+        "read_time": stats["read_time"],
+        "recc": extract_recommendation_urls(page),
+        "comments": comments,
+    }
+
+
+def store_article_data(
+    session: Session,
+    url_id: int,
+    data: Dict[str, Any],
+    with_login: bool,
+    insert_recc: bool = False,
+) -> Optional[Dict[str, bool]]:
+    """
+    Store a scraped article with its comments.
+    Args:
+        session (Session): SQLAlchemy session object.
+        url_id (int): ID of the article's URL.
+        data (Dict[str, Any]): Article data returned by scrape_article_data.
+        with_login (bool): Whether the page was loaded with login.
+        insert_recc (bool): Whether to store recommended article URLs.
+    Returns:
+        Optional[Dict[str, bool]]: "created" (a new article row was inserted) and
+            "is_free" on success, None on failure.
+    """
+    metadata = data["metadata"]
+    tags = data["tags"]
+    full_text = data["full_text"]
+    num_images = data["num_images"]
+    is_free = data["is_free"]
+    comments = data["comments"]
+
     with db_persist_lock:
         try:
 
@@ -559,6 +844,7 @@ def persist_article_data(
                 .filter(MediumArticle.url_id == url_id)
                 .first()
             )
+            created = article is None
             if article:
                 # Update article with individual statements
                 article.full_article_text = full_text
@@ -575,10 +861,10 @@ def persist_article_data(
                     description=metadata.get("description"),
                     publisher_type=metadata.get("publisher_type"),
                     is_free=is_free,
-                    claps=claps,
-                    comments_count=comments_count,
+                    claps=data["claps"],
+                    comments_count=data["comments_count"],
                     full_article_text=full_text,
-                    read_time=read_time,
+                    read_time=data["read_time"],
                     type=metadata.get("type"),
                     tags=tags,
                     num_images=num_images,
@@ -586,46 +872,22 @@ def persist_article_data(
 
             session.add(article)
             session.commit()
+            result = {"created": created, "is_free": is_free}
 
             if with_login:
-                return True
+                return result
 
             log_message(f"Found {len(comments)} comments", "info")
 
             if comments:
-                for comment in comments:
-                    author = get_or_create_author(
-                        session,
-                        comment.get("username"),
-                        comment.get("user_url"),
-                    )
-                    if (
-                        session.query(Comment)
-                        .filter(Comment.article_id == article.id)
-                        .filter(Comment.author_id == author.id if author else None)
-                        .first()
-                    ):
-                        continue
-
-                    try:
-                        comment_obj = Comment(
-                            id=(session.query(func.max(Comment.id)).scalar() or 0) + 1,
-                            article_id=article.id,
-                            author_id=author.id if author else None,
-                            text=comment.get("text"),
-                            claps=comment.get("claps"),
-                            references_article=comment.get("references_article"),
-                        )
-                        session.add(comment_obj)
-                        session.commit()
-                        session.flush()
-                    except Exception as e:
-                        session.rollback()
-                        log_message(f"Failed to persist comment: {e}", "error")
-                        continue
+                try:
+                    persist_comments(session, article.id, comments)
+                except Exception as e:
+                    session.rollback()
+                    log_message(f"Failed to persist comments: {e}", "error")
 
             if insert_recc:
-                for url in recc:
+                for url in data["recc"]:
                     if not session.query(URL).filter(URL.url == url).first():
                         new_url = URL(
                             id=session.query(func.max(URL.id)).scalar() + 1,
@@ -639,20 +901,108 @@ def persist_article_data(
                             {"priority": URL.priority + 0.1}
                         )
 
-            return True
+            return result
 
         except Exception as e:
             session.rollback()
             log_message(f"Failed to persist article data: {e}", "error")
-            return False
+            return None
+
+
+def persist_comments(
+    session: Session, article_id: int, comments: List[Dict[str, Any]]
+) -> int:
+    """
+    Insert the new comments of an article with a single executemany, falling
+    back to one insert per comment if the batch fails. Comments whose author
+    already commented on the article are skipped, as are comments without an
+    author once the article has any comment.
+    Args:
+        session (Session): SQLAlchemy session object.
+        article_id (int): ID of the article the comments belong to.
+        comments (List[Dict[str, Any]]): Comments returned by extract_comments.
+    Returns:
+        int: Number of inserted comments.
+    """
+    seen_authors = set(
+        session.scalars(
+            select(Comment.author_id).where(Comment.article_id == article_id)
+        )
+    )
+    rows = []
+    for comment in comments:
+        references_article = comment.get("references_article")
+        if references_article is None:
+            log_message("Skipping comment without references_article", "debug")
+            continue
+
+        author = get_or_create_author(
+            session,
+            comment.get("username"),
+            comment.get("user_url"),
+        )
+        author_id = author.id if author else None
+        # Without an author the old check matched any comment of the article,
+        # including the ones added earlier in this batch
+        if author_id in seen_authors or (author_id is None and seen_authors):
+            continue
+        seen_authors.add(author_id)
+
+        claps = comment.get("claps")
+        rows.append(
+            {
+                "article_id": article_id,
+                "author_id": author_id,
+                "text": comment.get("text"),
+                "claps": min(claps, COMMENT_CLAPS_MAX) if claps else claps,
+                "references_article": references_article,
+            }
+        )
+
+    if not rows:
+        return 0
+
+    next_id = (session.query(func.max(Comment.id)).scalar() or 0) + 1
+    for offset, row in enumerate(rows):
+        row["id"] = next_id + offset
+
+    # Core insert on the table: no ORM bulk-insert bookkeeping per row
+    try:
+        session.execute(insert(Comment.__table__), rows)
+        session.commit()
+        return len(rows)
+    except Exception as e:
+        session.rollback()
+        log_message(f"Bulk comment insert failed, retrying one by one: {e}", "warning")
+
+    # One bad comment must not cost the others
+    inserted = 0
+    for row in rows:
+        try:
+            session.execute(insert(Comment.__table__), [row])
+            session.commit()
+            inserted += 1
+        except Exception as e:
+            session.rollback()
+            log_message(f"Failed to persist comment: {e}", "error")
+    return inserted
 
 
 def setup_signal_handlers(shutdown_event: threading.Event) -> None:
     """
     Set up signal handlers for graceful shutdown.
+    Handlers are only installed from the main thread, and only once per event.
     Args:
         shutdown_event (threading.Event): Event to signal graceful shutdown.
     """
+    global _signal_shutdown_event
+
+    if threading.current_thread() is not threading.main_thread():
+        log_message("Signal handlers can only be set up in the main thread", "debug")
+        return
+
+    if _signal_shutdown_event is shutdown_event:
+        return
 
     def handler(sig, frame):
         log_message("Received signal. Shutting down gracefully...", "warning")
@@ -660,11 +1010,10 @@ def setup_signal_handlers(shutdown_event: threading.Event) -> None:
 
     signal.signal(signal.SIGINT, handler)
     signal.signal(signal.SIGTERM, handler)
+    _signal_shutdown_event = shutdown_event
 
 
 if __name__ == "__main__":
-    import time
-
     from playwright.sync_api import sync_playwright
 
     # Set the log level for more detailed output
@@ -692,10 +1041,10 @@ if __name__ == "__main__":
             # Navigate to the test article
             url = "https://medium.com/gitconnected/mocking-outbound-http-calls-in-golang-net-http-httptest-bc5629cd3c3e"
             log_message(f"Navigating to {url} on mobile browser", "info")
-            page.goto(url)
+            page.goto(url, wait_until="domcontentloaded")
 
-            # Wait for the page to load
-            page.wait_for_load_state("networkidle")
+            # Wait for the article to be attached
+            page.wait_for_selector("article, main", state="attached", timeout=5000)
 
             # Verify it's an article
             if not verify_its_an_article(page):
@@ -1,25 +1,261 @@
+import itertools
 import random
-import time
-from typing import Any, List, Optional
+import socket
+import threading
+from typing import Any, Dict, Iterator, List, Optional
 
 from playwright.sync_api import Browser, BrowserContext, Page
 
 from scraper.log_utils import log_message
 
+# File extensions of images, media and fonts, which are never needed to extract
+# article text or comments. Stylesheets stay enabled: comment filtering relies
+# on computed styles.
+BLOCKED_EXTENSIONS = (
+    "png",
+    "jpg",
+    "jpeg",
+    "gif",
+    "webp",
+    "svg",
+    "ico",
+    "mp4",
+    "webm",
+    "woff",
+    "woff2",
+    "ttf",
+    "otf",
+)
 
-def create_browser(playwright, headless: bool) -> Browser:
+# Analytics and ad hosts (and their subdomains) whose requests are aborted
+BLOCKED_HOSTS = (
+    "googletagmanager.com",
+    "google-analytics.com",
+    "doubleclick.net",
+    "segment.io",
+    "segment.com",
+    "hotjar.com",
+    "branch.io",
+)
+
+# CDP URL patterns blocked inside the browser, so that no request needs a
+# round-trip through a Python route handler. miro.medium.com serves all images.
+# Extensions only match at the end of the path, never in hosts or in
+# "@user.name" profile paths, since the patterns apply to documents as well.
+BLOCKED_URL_PATTERNS = (
+    *(f"*.{extension}" for extension in BLOCKED_EXTENSIONS),
+    *(f"*.{extension}?*" for extension in BLOCKED_EXTENSIONS),
+    "*://miro.medium.com/*",
+    *(f"*://{host}/*" for host in BLOCKED_HOSTS),
+    *(f"*://*.{host}/*" for host in BLOCKED_HOSTS),
+)
+
+# Responses open in a dialog; every loaded comment text is a <pre> element
+RESPONSES_DIALOG_SELECTOR = 'div[role="dialog"]'
+
+# Clicks the "See all responses" button if present; polled by wait_for_function
+CLICK_RESPONSES_JS = """
+() => {
+    const button = document.querySelector('button[aria-label="responses"]');
+    if (!button) return false;
+    button.click();
+    return true;
+}
+"""
+RESPONSES_BUTTON_POLL_MS = 250
+
+# Scrolls the responses dialog inside the browser until no new comments have
+# been added for quietMs, or maxMs has passed. Returns the number of comments.
+SCROLL_COMMENTS_JS = """
+({ maxScrolls, intervalMs, quietMs, maxMs }) => new Promise((resolve) => {
+    const dialog = document.querySelector('div[role="dialog"]');
+    const list = dialog && dialog.lastElementChild && dialog.lastElementChild.firstElementChild;
+    const count = () => document.querySelectorAll("pre").length;
+    if (!list) {
+        resolve(count());
+        return;
+    }
+    let lastMutation = Date.now();
+    const observer = new MutationObserver(() => { lastMutation = Date.now(); });
+    observer.observe(list, { childList: true, subtree: true });
+    const start = Date.now();
+    let scrolls = 0;
+    const timer = setInterval(() => {
+        list.scrollBy(0, 20000);
+        scrolls += 1;
+        const now = Date.now();
+        if (now - lastMutation > quietMs || now - start > maxMs || scrolls >= maxScrolls) {
+            clearInterval(timer);
+            observer.disconnect();
+            resolve(count());
+        }
+    }, intervalMs);
+})
+"""
+
+# Timing of the in-browser comment scroll loop in milliseconds
+COMMENT_SCROLL_INTERVAL_MS = 300
+COMMENT_SCROLL_QUIET_MS = 800
+COMMENT_SCROLL_MAX_MS = 30000
+
+# Launch flags that hide automation and cut Chromium's memory and startup cost
+CHROMIUM_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-features=TranslateUI",
+    "--mute-audio",
+    "--no-first-run",
+)
+
+# Only article pages show a read time
+READ_TIME_SELECTOR = "span[data-testid='storyReadTime']"
+
+# Present once the server-rendered page body is usable
+PAGE_READY_SELECTOR = "article, main"
+
+# Bot-check interstitial served instead of the page, whatever its HTTP status
+CHALLENGE_SELECTOR = (
+    "#challenge-form, #challenge-running, iframe[src*='challenges.cloudflare.com']"
+)
+
+# How long to wait for the read time before treating a page as no article
+VERIFY_ARTICLE_TIMEOUT_MS = 3000
+
+# Default timeout of every Playwright call that does not pass its own, so a
+# stuck page never blocks a worker for Playwright's 30 s default
+DEFAULT_TIMEOUT_MS = 15000
+
+# Fingerprint pools used to randomize each browser context. Viewports and
+# user agents are paired per device, so a context never reports an iPhone
+# user agent with an Android screen size.
+DEVICE_PROFILES = (
+    (
+        {"width": 390, "height": 844},
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 14_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0.3 Mobile/15E148 Safari/604.1",
+    ),
+    (
+        {"width": 375, "height": 667},
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 13_5_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/13.1.1 Mobile/15E148 Safari/604.1",
+    ),
+    (
+        {"width": 414, "height": 896},
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 13_2_3 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/13.0.3 Mobile/15E148 Safari/604.1",
+    ),
+    (
+        {"width": 360, "height": 640},
+        "Mozilla/5.0 (Linux; Android 8.0.0; SM-G950F Build/R16NW) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/63.0.3239.111 Mobile Safari/537.36",
+    ),
+    (
+        {"width": 412, "height": 915},
+        "Mozilla/5.0 (Linux; Android 11; Pixel 5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.91 Mobile Safari/537.36",
+    ),
+)
+LOCALES = (
+    "en-US",
+    "en-GB",
+    "fr-FR",
+    "de-DE",
+    "es-ES",
+    "it-IT",
+    "pt-PT",
+    "ja-JP",
+    "zh-CN",
+)
+DEVICE_SCALE_FACTORS = (1, 2)
+
+# Every combination of the pools above, built once at import
+CONTEXT_PROFILES = tuple(
+    {
+        "viewport": viewport,
+        "user_agent": user_agent,
+        "locale": locale,
+        "device_scale_factor": device_scale_factor,
+    }
+    for (viewport, user_agent), locale, device_scale_factor in itertools.product(
+        DEVICE_PROFILES, LOCALES, DEVICE_SCALE_FACTORS
+    )
+)
+
+# Per-thread state (each worker thread gets its own RNG)
+_thread_state = threading.local()
+
+
+def get_rng() -> random.Random:
+    """
+    Get the random number generator of the current thread.
+    Returns:
+        random.Random: A thread-local random number generator.
+    """
+    rng = getattr(_thread_state, "rng", None)
+    if rng is None:
+        rng = _thread_state.rng = random.Random()
+    return rng
+
+
+def next_context_profile() -> Dict[str, Any]:
+    """
+    Get the next fingerprint profile of the current thread. Each thread cycles
+    through its own shuffled copy of CONTEXT_PROFILES, so no lock is needed.
+    Returns:
+        Dict[str, Any]: A copy of the context options of the profile.
+    """
+    profiles: Optional[Iterator[Dict[str, Any]]] = getattr(
+        _thread_state, "profiles", None
+    )
+    if profiles is None:
+        shuffled = list(CONTEXT_PROFILES)
+        get_rng().shuffle(shuffled)
+        profiles = _thread_state.profiles = itertools.cycle(shuffled)
+    return dict(next(profiles))
+
+
+def find_free_port() -> int:
+    """
+    Ask the OS for a free TCP port on the loopback interface.
+    Returns:
+        int: A port that was unused when checked.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def create_browser(
+    playwright, headless: bool, debugging_port: Optional[int] = None
+) -> Browser:
     """
     Create a Playwright browser instance.
     Args:
         playwright: The Playwright instance.
         headless (bool): Whether to run in headless mode.
+        debugging_port (Optional[int]): Expose CDP on this loopback port so
+            other threads can share the browser via connect_shared_browser.
     Returns:
         Browser: The Playwright browser instance
     """
-    return playwright.chromium.launch(
-        headless=headless,
-        args=["--disable-blink-features=AutomationControlled"],
-    )
+    args = list(CHROMIUM_ARGS)
+    if debugging_port:
+        args.append("--remote-debugging-address=127.0.0.1")
+        args.append(f"--remote-debugging-port={debugging_port}")
+
+    # Ctrl+C is handled by the scraper's graceful shutdown, not by Playwright
+    return playwright.chromium.launch(headless=headless, args=args, handle_sigint=False)
+
+
+def connect_shared_browser(playwright, port: int) -> Browser:
+    """
+    Connect to a browser launched by create_browser with a debugging port.
+    Args:
+        playwright: The Playwright instance of the calling thread.
+        port (int): CDP port of the shared browser.
+    Returns:
+        Browser: A connection to the shared browser. Closing it only
+            disconnects and closes the contexts created through it.
+    """
+    return playwright.chromium.connect_over_cdp(f"http://localhost:{port}")
 
 
 def get_context(browser: Browser, with_login: bool) -> BrowserContext:
@@ -31,45 +267,13 @@ def get_context(browser: Browser, with_login: bool) -> BrowserContext:
     Returns:
         BrowserContext: The browser context with a randomized user agent.
     """
-    context_options = {
-        "viewport": random.choice(
-            [
-                {"width": 390, "height": 844},
-                {"width": 375, "height": 667},
-                {"width": 414, "height": 896},
-                {"width": 360, "height": 640},
-                {"width": 412, "height": 915},
-            ]
-        ),
-        "user_agent": random.choice(
-            [
-                "Mozilla/5.0 (iPhone; CPU iPhone OS 14_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0.3 Mobile/15E148 Safari/604.1",
-                "Mozilla/5.0 (iPhone; CPU iPhone OS 13_5_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/13.1.1 Mobile/15E148 Safari/604.1",
-                "Mozilla/5.0 (iPhone; CPU iPhone OS 13_2_3 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/13.0.3 Mobile/15E148 Safari/604.1",
-                "Mozilla/5.0 (Linux; Android 8.0.0; SM-G950F Build/R16NW) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/63.0.3239.111 Mobile Safari/537.36",
-                "Mozilla/5.0 (Linux; Android 11; Pixel 5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.91 Mobile Safari/537.36",
-            ]
-        ),
-        "locale": random.choice(
-            [
-                "en-US",
-                "en-GB",
-                "fr-FR",
-                "de-DE",
-                "es-ES",
-                "it-IT",
-                "pt-PT",
-                "ja-JP",
-                "zh-CN",
-            ]
-        ),
-        "device_scale_factor": random.choice([1, 2]),
-    }
+    context_options = next_context_profile()
 
     if with_login:
         context_options["storage_state"] = "login_state.json"
 
     context = browser.new_context(**context_options)
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
 
     # Mask automation
     context.add_init_script(
@@ -79,18 +283,37 @@ def get_context(browser: Browser, with_login: bool) -> BrowserContext:
     return context
 
 
-def random_mouse_movement(page: Page) -> None:
+def new_scraping_page(context: BrowserContext) -> Page:
+    """
+    Open a page that skips heavy subresources and trackers to cut bandwidth and
+    page-load time. Blocking happens in the browser via CDP.
+    Args:
+        context (BrowserContext): The browser context to open the page in.
+    Returns:
+        Page: The new page.
+    """
+    page = context.new_page()
+    client = context.new_cdp_session(page)
+    client.send("Network.enable")
+    client.send("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+    client.send("Network.setBypassServiceWorker", {"bypass": True})
+    return page
+
+
+def random_mouse_movement(page: Page, pause: bool = False) -> None:
     """
     Simulate random mouse movements and scrolling.
     Args:
         page (Page): The Playwright page instance.
+        pause (bool): Whether to add human-like pauses around the movement.
     """
-    time.sleep(random.uniform(0.5, 1.5))
-    page.mouse.move(
-        random.randint(0, 300), random.randint(0, 300), steps=random.randint(10, 20)
-    )
-    page.mouse.wheel(0, random.randint(100, 300))
-    time.sleep(random.uniform(0.3, 0.8))
+    rng = get_rng()
+    if pause:
+        page.wait_for_timeout(rng.uniform(500, 1500))
+    page.mouse.move(rng.randint(0, 300), rng.randint(0, 300), steps=rng.randint(10, 20))
+    page.mouse.wheel(0, rng.randint(100, 300))
+    if pause:
+        page.wait_for_timeout(rng.uniform(300, 800))
 
 
 def close_overlay(page: Page) -> None:
@@ -112,50 +335,33 @@ def close_overlay(page: Page) -> None:
         log_message(f"Error closing overlay: {e}", "debug")
 
 
-def click_see_all_responses(page: Page, timeout: int = 1000):
+def click_see_all_responses(page: Page, timeout: int = 2000):
     """
     Click the "See all responses" button if it exists.
     Args:
         page (Page): Playwright Page object.
-        timeout (int): Timeout for the click action.
+        timeout (int): How long to wait for the button in milliseconds.
     Returns:
         bool: True if the button was clicked, False otherwise.
     """
     try:
-        page.evaluate(
-            """
-        () => {
-            const clickButton = () => {
-                const button = document.querySelector('button[aria-label="responses"]');
-                if (button) {
-                    button.click();
-                    return true;
-                }
-                return false;
-            };
-            
-            // Try clicking up to 3 times
-            if (clickButton()) return true;
-            
-            return new Promise((resolve) => {
-                setTimeout(() => {
-                    if (clickButton()) resolve(true);
-                    else {
-                        setTimeout(() => {
-                            if (clickButton()) resolve(true);
-                            else resolve(false);
-                        }, 1000);
-                    }
-                }, 1000);
-            });
-        }
-        """
+        # The browser polls for the button and clicks it as soon as it appears
+        page.wait_for_function(
+            CLICK_RESPONSES_JS, polling=RESPONSES_BUTTON_POLL_MS, timeout=timeout
         )
-        return True
     except Exception as e:
         log_message(f"Failed to click responses button: {e}", "debug")
         return False
 
+    try:
+        # Wait for the dialog itself instead of the network going idle
+        page.wait_for_selector(
+            RESPONSES_DIALOG_SELECTOR, state="attached", timeout=5000
+        )
+    except Exception as e:
+        log_message(f"Responses dialog did not open: {e}", "debug")
+    return True
+
 
 def scroll_to_load_comments(page: Page, max_scrolls: int = 100) -> None:
     """
@@ -164,37 +370,38 @@ def scroll_to_load_comments(page: Page, max_scrolls: int = 100) -> None:
         page (Page): Playwright Page object.
         max_scrolls (int): Maximum number of scrolls to perform.
     """
-    html = page.content()
-    for _ in range(max_scrolls):
-        try:
-            page.evaluate(
-                """
-                () => {
-                    const dialog = document.querySelector('div[role="dialog"]');
-                    if (dialog) dialog.lastElementChild.firstElementChild.scrollBy(0, 20000);
-                }
-            """
-            )
-            page.wait_for_timeout(1000)
-            page.wait_for_load_state("load", timeout=5000)
-            if page.content() == html:
-                return
-            html = page.content()
-        except Exception as e:
-            log_message(f"Scroll error on page {page.url}: {e}", "warning")
-            return
+    # The whole loop runs in the browser: a MutationObserver on the comment list
+    # tells when loading has settled, so Python waits on a single evaluate.
+    try:
+        comment_count = page.evaluate(
+            SCROLL_COMMENTS_JS,
+            {
+                "maxScrolls": max_scrolls,
+                "intervalMs": COMMENT_SCROLL_INTERVAL_MS,
+                "quietMs": COMMENT_SCROLL_QUIET_MS,
+                "maxMs": COMMENT_SCROLL_MAX_MS,
+            },
+        )
+        log_message(f"Loaded {comment_count} comments on {page.url}", "debug")
+    except Exception as e:
+        log_message(f"Scroll error on page {page.url}: {e}", "warning")
 
 
-def verify_its_an_article(page: Page) -> bool:
+def verify_its_an_article(
+    page: Page, timeout: float = VERIFY_ARTICLE_TIMEOUT_MS
+) -> bool:
     """
-    Verify if the page is an article.
+    Verify if the page is an article. Waits for the read time to be attached,
+    so callers only need to wait for domcontentloaded.
     Args:
         page (Page): Playwright Page object.
+        timeout (float): Maximum time to wait for the read time in milliseconds.
     Returns:
         bool: True if the page is an article, False otherwise.
     """
     try:
-        return page.query_selector("span[data-testid='storyReadTime']") is not None
+        page.wait_for_selector(READ_TIME_SELECTOR, state="attached", timeout=timeout)
+        return True
     except Exception as e:
         log_message(f"Error verifying article: {e}", "debug")
         return False
@@ -219,7 +426,7 @@ def perform_interactive_login(storage_path: str = "login_state.json") -> None:
             context = browser.new_context()
             page = context.new_page()
             try:
-                page.goto("https://medium.com/m/signin", wait_until="load", timeout=30000)
+                page.goto("https://medium.com/m/signin", wait_until="domcontentloaded", timeout=30000)
             except Exception as e:
                 log_message(f"Failed to open Medium sign-in page: {e}", "warning")
 
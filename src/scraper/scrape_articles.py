@@ -1,13 +1,13 @@
 import argparse
 import os
-import random
 import time
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from queue import Queue
+from queue import Empty, Full, Queue
 from threading import Event, Lock, Thread
-from typing import Any, List, Optional
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
-from playwright.sync_api import Browser, BrowserContext, sync_playwright
+from playwright.sync_api import BrowserContext, Page, sync_playwright
 from rich.console import Console, ConsoleOptions, Group, RenderResult
 from rich.live import Live
 from rich.panel import Panel
@@ -15,6 +15,7 @@ from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 from rich.text import Text
 from rich.traceback import install as install_rich_traceback
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 try:
@@ -24,269 +25,633 @@ try:
 except ImportError:
     WANDB_AVAILABLE = False
 
-from database.database import URL, MediumArticle, SessionLocal
-from scraper.log_utils import log_lock, log_message, log_messages, set_log_level
+from database.database import URL, MediumArticle, ScopedSession, SessionLocal
+from scraper.log_utils import (
+    get_log_version,
+    log_lock,
+    log_message,
+    log_messages,
+    set_log_level,
+)
 from scraper.medium_helpers import (
     fetch_random_urls,
     fetch_failed_urls,
-    persist_article_data,
+    flush_url_status_buffer,
+    scrape_article_data,
     setup_signal_handlers,
-    update_url_status,
+    store_article_data,
+    queue_url_status,
+    url_status_writer,
 )
 from scraper.playwright_helpers import (
+    CHALLENGE_SELECTOR,
+    PAGE_READY_SELECTOR,
+    connect_shared_browser,
     create_browser,
+    find_free_port,
     get_context,
+    new_scraping_page,
+    get_rng,
     random_mouse_movement,
     verify_its_an_article,
     perform_interactive_login,
 )
 
 # Set up rich console and traceback
-install_rich_traceback(show_locals=True)
+install_rich_traceback(show_locals=False)
 console = Console()
 
 # Global state variables
 shutdown_event = Event()
-completed_tasks = 0
 start_time = 0
-metrics_lock = Lock()
 
+# Wall-clock budget for loading an article until its content is attached
+NAVIGATION_BUDGET_MS = 15000
+
+# Number of articles a worker scrapes before it gets a fresh browser context
+CONTEXT_ROTATION_PAGES = 50
+
+# Tasks buffered per worker, so memory stays bounded however many URLs are fetched
+TASKS_PER_WORKER = 4
+
+# Random pause in seconds between two requests of the same worker
+REQUEST_JITTER_SECONDS = (0.05, 0.2)
+
+# Responses that mean Medium is pushing back. The page is dropped and all
+# workers hold their next request until challenge_backoff_until (monotonic
+# time). The delay starts at the base in seconds and doubles on each further
+# challenge up to the cap; a page that is not challenged resets it. Pages that
+# finish while a backoff runs were requested before it, so they change nothing.
+CHALLENGE_STATUSES = frozenset({403, 429})
+CHALLENGE_BACKOFF_SECONDS = (5.0, 300.0)
+challenge_lock = Lock()
+challenge_delay = 0.0
+challenge_backoff_until = 0.0
+
+# Scraped articles waiting for the database writer thread. Bounded, so the
+# workers pause instead of piling up articles when the database falls behind.
+ARTICLE_WRITE_QUEUE_SIZE = 20
+article_write_queue: Queue = Queue(maxsize=ARTICLE_WRITE_QUEUE_SIZE)
 
-def update_metrics() -> None:
+# Metrics are handed to a background thread so wandb.log never stalls the
+# monitor loop. Snapshots are dropped while the queue is full.
+WANDB_LOG_INTERVAL_SECONDS = 10
+
+# The monitor loop wakes this often, but only pushes a progress update when the
+# count changed or the shown speed is older than PROGRESS_UPDATE_SECONDS
+MONITOR_INTERVAL_SECONDS = 0.5
+PROGRESS_UPDATE_SECONDS = 1.0
+wandb_queue: Queue = Queue(maxsize=100)
+
+# Last rendered log panel and the log version it shows
+log_panel_cache: Tuple[int, Optional[Panel]] = (-1, None)
+
+# Number of URLs the producer has queued so far (written by the producer only)
+queued_tasks = 0
+
+# Completed tasks and newly stored free and premium articles. Only the article
+# writer thread updates them, so no lock is needed.
+completed_tasks = 0
+new_free_articles = 0
+new_premium_articles = 0
+
+# Article counts are re-read from the database at most this often; in between
+# they are kept up to date from the articles persisted by this run. The
+# baseline holds the DB counts (total, free, premium) and the new_free and
+# new_premium counters at the time they were read.
+ARTICLE_COUNTS_REFRESH_SECONDS = 300
+ARTICLE_COUNTS_QUERY = select(
+    func.count(),
+    func.count().filter(MediumArticle.is_free.is_(True)),
+    func.count().filter(MediumArticle.is_free.is_(False)),
+).select_from(MediumArticle)
+article_counts_baseline = (0, 0, 0, 0, 0)
+article_counts_refreshed_at = 0.0
+
+
+def update_metrics(is_free: Optional[bool] = None) -> None:
     """
     Update the metrics for completed tasks.
+    Args:
+        is_free (Optional[bool]): Whether a newly stored article is free, or
+            None if no new article row was created.
     """
-    global completed_tasks
-    with metrics_lock:
-        completed_tasks += 1
+    global completed_tasks, new_free_articles, new_premium_articles
 
+    completed_tasks += 1
+    if is_free is True:
+        new_free_articles += 1
+    elif is_free is False:
+        new_premium_articles += 1
 
-def get_current_metrics() -> dict:
+
+def refresh_article_counts() -> None:
+    """
+    Re-baseline the cached article counts from the database.
+    """
+    global article_counts_baseline, article_counts_refreshed_at
+
+    new_free, new_premium = new_free_articles, new_premium_articles
+    with SessionLocal() as session:
+        total_articles, free_articles, premium_articles = session.execute(
+            ARTICLE_COUNTS_QUERY
+        ).one()
+
+    article_counts_baseline = (
+        total_articles,
+        free_articles,
+        premium_articles,
+        new_free,
+        new_premium,
+    )
+    article_counts_refreshed_at = time.time()
+
+
+@dataclass(slots=True)
+class Metrics:
+    """Snapshot of the scraper metrics. Field names are the wandb keys."""
+
+    articles_processed: int = 0
+    elapsed_minutes: float = 0.0
+    articles_per_minute: float = 0.0
+    seconds_per_article: float = 0.0
+    total_articles: int = 0
+    free_articles: int = 0
+    premium_articles: int = 0
+    free_ratio: float = 0.0
+    premium_ratio: float = 0.0
+
+
+# Rows of the metrics panel as (label, Metrics attribute, format spec)
+METRICS_DISPLAY_ROWS = (
+    ("Articles Processed", "articles_processed", "{:,}"),
+    ("Processing Speed", "articles_per_minute", "{:.1f}/min"),
+    ("Time per Article", "seconds_per_article", "{:.1f}s"),
+    ("Total Articles", "total_articles", "{:,}"),
+    ("Free Articles", "free_articles", "{:,}"),
+    ("Premium Articles", "premium_articles", "{:,}"),
+    ("Elapsed Time", "elapsed_minutes", "{:.1f}min"),
+)
+
+
+def get_current_metrics(refresh_counts: bool = False) -> Metrics:
     """
-    Get current metrics for logging.
+    Get current metrics for logging. Only reads in-memory counters unless
+    refresh_counts is set.
+    Args:
+        refresh_counts (bool): Re-read the article counts from the database first.
     Returns:
-        dict: Dictionary of current metrics
+        Metrics: Snapshot of the current metrics
     """
-    global completed_tasks, start_time
-    with metrics_lock:
-        elapsed_time = time.time() - start_time
-        articles_processed = completed_tasks
+    if refresh_counts:
+        refresh_article_counts()
+
+    elapsed_time = time.time() - start_time
+    articles_processed = completed_tasks
+    new_free, new_premium = new_free_articles, new_premium_articles
+    base_total, base_free, base_premium, base_new_free, base_new_premium = (
+        article_counts_baseline
+    )
+    free_articles = base_free + new_free - base_new_free
+    premium_articles = base_premium + new_premium - base_new_premium
+    total_articles = (
+        base_total + new_free + new_premium - base_new_free - base_new_premium
+    )
 
     speed = articles_processed / (elapsed_time / 60) if elapsed_time > 0 else 0
     processing_time_per_article = 60 / speed if speed > 0 else 0
+    free_ratio = free_articles / total_articles if total_articles > 0 else 0
+    premium_ratio = premium_articles / total_articles if total_articles > 0 else 0
+
+    return Metrics(
+        articles_processed=articles_processed,
+        elapsed_minutes=elapsed_time / 60,
+        articles_per_minute=speed,
+        seconds_per_article=processing_time_per_article,
+        total_articles=total_articles,
+        free_articles=free_articles,
+        premium_articles=premium_articles,
+        free_ratio=free_ratio,
+        premium_ratio=premium_ratio,
+    )
 
-    with SessionLocal() as session:
-        total_articles = session.query(MediumArticle).count()
-        free_articles = session.query(MediumArticle).filter_by(is_free=True).count()
-        premium_articles = session.query(MediumArticle).filter_by(is_free=False).count()
-        free_ratio = free_articles / total_articles if total_articles > 0 else 0
-        premium_ratio = premium_articles / total_articles if total_articles > 0 else 0
-
-    return {
-        "articles_processed": articles_processed,
-        "elapsed_minutes": elapsed_time / 60,
-        "articles_per_minute": speed,
-        "seconds_per_article": processing_time_per_article,
-        "total_articles": total_articles,
-        "free_articles": free_articles,
-        "premium_articles": premium_articles,
-        "free_ratio": free_ratio,
-        "premium_ratio": premium_ratio,
-    }
-
-
-def create_metrics_display(metrics: dict) -> Panel:
+
+def wandb_logger() -> None:
+    """
+    Log queued metrics to wandb until a None item arrives.
+    """
+    while True:
+        metrics = wandb_queue.get()
+        if metrics is None:
+            break
+        try:
+            wandb.log(asdict(metrics))
+        except Exception as e:
+            log_message(f"Error logging to wandb: {str(e)}", "warning")
+
+
+def create_metrics_display(metrics: Metrics) -> Panel:
     """Create a simplified metrics display panel."""
     table = Table(show_header=False, expand=True)
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green", justify="left")
 
-    metrics_data = [
-        ("Articles Processed", f"{metrics.get('articles_processed', 0):,}"),
-        ("Processing Speed", f"{metrics.get('articles_per_minute', 0):.1f}/min"),
-        ("Time per Article", f"{metrics.get('seconds_per_article', 0):.1f}s"),
-        ("Total Articles", f"{metrics.get('total_articles', 0):,}"),
-        ("Free Articles", f"{metrics.get('free_articles', 0):,}"),
-        ("Premium Articles", f"{metrics.get('premium_articles', 0):,}"),
-        ("Elapsed Time", f"{metrics.get('elapsed_minutes', 0):.1f}min"),
-    ]
-
-    for metric, value in metrics_data:
-        table.add_row(metric, value)
+    for label, attr, fmt in METRICS_DISPLAY_ROWS:
+        table.add_row(label, fmt.format(getattr(metrics, attr)))
 
     return Panel(table, title="Medium Scraper Progress", border_style="blue")
 
 
 def create_log_panel() -> Panel:
     """
-    Create a panel with the latest log messages.
+    Create a panel with the latest log messages. The panel is reused until a
+    new message is logged, so the markup is only parsed once per change.
     Returns:
         Panel: A panel with formatted log messages
     """
+    global log_panel_cache
+
+    version = get_log_version()
+    if log_panel_cache[0] == version:
+        return log_panel_cache[1]
+
     with log_lock:
         # Get a copy of current log messages
-        messages = log_messages.copy()
+        messages = list(log_messages)
 
     log_text = "\n".join(messages) if messages else "[dim]No log messages yet...[/]"
-    return Panel(
+    panel = Panel(
         Text.from_markup(log_text), title="Log Messages", border_style="yellow"
     )
+    log_panel_cache = (version, panel)
+    return panel
+
+
+def remaining_timeout_ms(deadline: float) -> float:
+    """
+    Get the time left until a deadline as a Playwright timeout.
+    Args:
+        deadline (float): Deadline on the time.monotonic() clock.
+    Returns:
+        float: Remaining milliseconds, at least 1 so Playwright never waits forever.
+    """
+    return max(1.0, (deadline - time.monotonic()) * 1000)
+
+
+def record_challenge_result(challenged: bool) -> float:
+    """
+    Update the backoff shared by all workers after a page was loaded.
+    Args:
+        challenged (bool): Whether the page got a challenge response.
+    Returns:
+        float: Seconds left in the backoff, 0 if none is running.
+    """
+    global challenge_delay, challenge_backoff_until
+
+    with challenge_lock:
+        now = time.monotonic()
+        if now < challenge_backoff_until:
+            return challenge_backoff_until - now
+
+        if challenged:
+            base, cap = CHALLENGE_BACKOFF_SECONDS
+            challenge_delay = min(cap, max(base, challenge_delay * 2))
+            challenge_backoff_until = now + challenge_delay
+            return challenge_delay
+
+        challenge_delay = 0.0
+        return 0.0
+
+
+def challenge_backoff_remaining() -> float:
+    """
+    Returns:
+        float: Seconds until workers may request pages again, 0 if now.
+    """
+    return max(0.0, challenge_backoff_until - time.monotonic())
 
 
 def process_article(
     url_data: tuple[int, str],
-    browser: Browser,
+    page: Page,
     worker_idx: int,
-    session: Session,
     with_login: bool,
-) -> None:
+    stealth: bool = False,
+    move_mouse: bool = True,
+) -> bool:
     """
-    Process a single article URL.
+    Process a single article URL. The scraped article is handed to the
+    article writer thread, which stores it and records the URL status.
     Args:
         url_data (tuple[int, str]): Tuple containing URL ID and URL.
-        browser (Browser): The Playwright browser instance.
+        page (Page): The worker's reusable page in its long-lived browser context.
         worker_idx (int): Index of the worker thread.
-        session (Session): SQLAlchemy session for database operations.
         with_login (bool): Whether to login to Medium.
+        stealth (bool): Whether to add human-like pauses to the mouse movement.
+        move_mouse (bool): Whether to simulate mouse movement on this page.
+            Always done in stealth mode.
+    Returns:
+        bool: True if Medium answered with a challenge status.
     """
 
     # stopping gracefully
     if shutdown_event.is_set():
-        return
+        return False
 
     url_id, url = url_data
-    context = None
 
     try:
         log_message(f"Worker {worker_idx} starting to process URL ID {url_id}", "debug")
-        context = get_context(browser, with_login)
 
-        with context.new_page() as page:
-            log_message(f"Processing URL: {url}")
+        # Start every article as a fresh visitor. Login runs keep their
+        # cookies, since those carry the Medium session.
+        if not with_login:
+            page.context.clear_cookies()
+            page.context.clear_permissions()
 
-            # Navigate to the URL with proper error handling
-            try:
-                log_message(f"Opening URL with timeout of 20000ms", "debug")
-                page.goto(url, wait_until="load", timeout=20000)
-                page.wait_for_timeout(random.uniform(500, 2000))
-            except Exception as e:
-                log_message(f"Error loading URL {url}: {str(e)}", "error")
-                update_url_status(
-                    session, url_id, "navigation_error", str(e), with_login=with_login
-                )
-                return
+        log_message(f"Processing URL: {url}")
+
+        # Navigate to the URL with proper error handling. Navigation and
+        # the readiness wait share one budget so slow pages are cut short.
+        try:
+            log_message(
+                f"Opening URL with a budget of {NAVIGATION_BUDGET_MS}ms", "debug"
+            )
+            deadline = time.monotonic() + NAVIGATION_BUDGET_MS / 1000
+            response = page.goto(
+                url, wait_until="domcontentloaded", timeout=NAVIGATION_BUDGET_MS
+            )
+            if response is not None and response.status in CHALLENGE_STATUSES:
+                challenge = f"HTTP {response.status}"
+            elif page.query_selector(CHALLENGE_SELECTOR) is not None:
+                challenge = "challenge page"
+            else:
+                challenge = None
+            if challenge:
+                log_message(f"Got {challenge} for {url}, backing off", "warning")
+                queue_url_status(url_id, "challenged", challenge, with_login=with_login)
+                return True
+            page.wait_for_selector(
+                PAGE_READY_SELECTOR,
+                state="attached",
+                timeout=remaining_timeout_ms(deadline),
+            )
+        except Exception as e:
+            log_message(f"Error loading URL {url}: {str(e)}", "error")
+            queue_url_status(url_id, "navigation_error", str(e), with_login=with_login)
+            return False
 
-            # Add random mouse movement to appear more human-like
+        # Add random mouse movement to appear more human-like
+        if move_mouse or stealth:
             try:
-                random_mouse_movement(page)
+                random_mouse_movement(page, pause=stealth)
             except Exception as e:
                 log_message(f"Error during random mouse movement: {str(e)}", "debug")
                 # Continue despite mouse movement error
 
-            # Verify the page is an article
-            try:
-                log_message(f"Verifying if URL is an article: {url}", "debug")
-                if not verify_its_an_article(page):
-                    log_message(f"URL is not an article: {url}", "warning")
-                    update_url_status(
-                        session, url_id, "not_article", with_login=with_login
-                    )
-                    return
-            except Exception as e:
-                log_message(f"Error verifying article: {str(e)}", "error")
-                update_url_status(
-                    session, url_id, "verification_error", str(e), with_login=with_login
-                )
-                return
+        # Verify the page is an article
+        try:
+            log_message(f"Verifying if URL is an article: {url}", "debug")
+            if not verify_its_an_article(page):
+                log_message(f"URL is not an article: {url}", "warning")
+                queue_url_status(url_id, "not_article", with_login=with_login)
+                return False
+        except Exception as e:
+            log_message(f"Error verifying article: {str(e)}", "error")
+            queue_url_status(
+                url_id, "verification_error", str(e), with_login=with_login
+            )
+            return False
 
-            # Persist article data
-            try:
-                log_message(f"Persisting article data for URL: {url}", "debug")
-                if not persist_article_data(session, url_id, page, with_login):
-                    log_message(
-                        f"Failed to persist article data for URL: {url}", "error"
-                    )
-                    update_url_status(
-                        session, url_id, "persist_error", with_login=with_login
-                    )
-                    return
-            except Exception as e:
-                log_message(f"Error persisting article data: {str(e)}", "error")
-                update_url_status(
-                    session, url_id, "persist_error", str(e), with_login=with_login
-                )
-                return
+        # Scrape the article data; storing it happens on the writer thread
+        try:
+            log_message(f"Scraping article data for URL: {url}", "debug")
+            data = scrape_article_data(page, with_login)
+        except Exception as e:
+            log_message(f"Error scraping article data: {str(e)}", "error")
+            queue_url_status(url_id, "persist_error", str(e), with_login=with_login)
+            return False
 
-            # Update URL status and metrics
-            update_url_status(session, url_id, "success", with_login=with_login)
-            log_message(f"Processed URL: {url}", "success")
-            update_metrics()
+        article_write_queue.put((url_id, url, data, with_login))
+        return False
 
     except Exception as e:
         log_message(f"Error processing URL {url}: {str(e)}", "error")
         log_message(f"Exception details: {repr(e)}", "debug")
-        update_url_status(session, url_id, "error", str(e), with_login=with_login)
-    finally:
-        # Ensure context is closed to prevent memory leaks
-        if context:
-            try:
-                context.close()
-            except Exception as e:
-                log_message(f"Error closing context: {str(e)}", "debug")
+        queue_url_status(url_id, "error", str(e), with_login=with_login)
+        return False
+
+
+def article_writer(session_factory: callable, stop: Event) -> None:
+    """
+    Store scraped articles from the write queue until stop is set and it is
+    empty, so the browser workers never wait on the database.
+    Args:
+        session_factory (callable): Function to create a session instance.
+        stop (Event): Event to signal that no more articles will come.
+    """
+    with session_factory() as session:
+        try:
+            while not (stop.is_set() and article_write_queue.empty()):
+                try:
+                    url_id, url, data, with_login = article_write_queue.get(
+                        timeout=MONITOR_INTERVAL_SECONDS
+                    )
+                except Empty:
+                    continue
+
+                try:
+                    result = store_article_data(session, url_id, data, with_login)
+                except Exception as e:
+                    session.rollback()
+                    log_message(f"Error persisting article data: {str(e)}", "error")
+                    queue_url_status(
+                        url_id, "persist_error", str(e), with_login=with_login
+                    )
+                    continue
+
+                if not result:
+                    log_message(
+                        f"Failed to persist article data for URL: {url}", "error"
+                    )
+                    queue_url_status(url_id, "persist_error", with_login=with_login)
+                    continue
+
+                # Update URL status and metrics. Only newly inserted articles
+                # change the cached article counts.
+                queue_url_status(url_id, "success", with_login=with_login)
+                log_message(f"Processed URL: {url}", "success")
+                update_metrics(result["is_free"] if result["created"] else None)
+        finally:
+            flush_url_status_buffer()
+            ScopedSession.remove()
 
 
 def worker_thread(
     task_queue: Queue,
     browser_factory: callable,
-    session_factory: callable,
     shutdown: Event,
     with_login: bool = False,
+    stealth: bool = False,
 ) -> None:
     """
     Worker thread to process tasks from the queue.
     Args:
-        task_queue (Queue): The queue containing tasks to process.
+        task_queue (Queue): The queue containing tasks to process. A None
+            item tells the worker to stop.
         browser_factory (callable): Function to create a browser instance.
-        session_factory (callable): Function to create a session instance.
         shutdown (Event): Event to signal graceful shutdown.
         with_login (bool): Whether to login to Medium.
+        stealth (bool): Whether to add human-like pauses to the mouse movement.
     """
     log_message("Worker thread starting", "debug")
 
-    while not shutdown.is_set():
+    # One Playwright driver, browser and context for the lifetime of the worker
+    with sync_playwright() as p:
+        browser = None
+        context = None
+
         try:
-            task = task_queue.get(timeout=1)
-            if task is None:
-                log_message("Received termination signal, stopping worker", "debug")
-                task_queue.task_done()
-                break
+            browser = browser_factory(p)
+            context = get_context(browser, with_login)
+            page = None
+            pages_in_context = 0
 
-            url_data, worker_idx = task
-            log_message(
-                f"Got task for URL ID {url_data[0]} assigned to worker {worker_idx}",
-                "debug",
-            )
+            # Per-thread RNG, so the jitter never contends on the module-level one
+            rng = get_rng()
+
+            while True:
+                # Block until work arrives; the producer sends a None sentinel per worker
+                task = task_queue.get()
+                if task is None or shutdown.is_set():
+                    log_message("Stopping worker", "debug")
+                    break
 
-            with sync_playwright() as p:
-                browser = browser_factory(p)
                 try:
-                    with session_factory() as session:
-                        process_article(
-                            url_data, browser, worker_idx, session, with_login
+                    url_data, worker_idx = task
+                    log_message(
+                        f"Got task for URL ID {url_data[0]} assigned to worker {worker_idx}",
+                        "debug",
+                    )
+
+                    # The browser outlives single tasks, so recover if it crashed
+                    if not browser.is_connected():
+                        log_message("Browser disconnected, relaunching", "warning")
+                        browser = browser_factory(p)
+                        context = get_context(browser, with_login)
+                        page = None
+                        pages_in_context = 0
+
+                    # Rotate the context (and its fingerprint) every few pages
+                    elif pages_in_context >= CONTEXT_ROTATION_PAGES:
+                        log_message("Rotating browser context", "debug")
+                        context.close()
+                        context = get_context(browser, with_login)
+                        page = None
+                        pages_in_context = 0
+
+                    # One page per context, reused across articles via goto()
+                    if page is None or page.is_closed():
+                        page = new_scraping_page(context)
+
+                    # Small jitter between requests instead of idling on each
+                    # page, then wait out a backoff started by any worker.
+                    # Waiting on the event lets a shutdown cut the backoff short.
+                    delay = rng.uniform(*REQUEST_JITTER_SECONDS)
+                    while delay > 0 and not shutdown.wait(delay):
+                        delay = challenge_backoff_remaining()
+                    if shutdown.is_set():
+                        log_message("Stopping worker", "debug")
+                        break
+
+                    # Outside stealth mode, move the mouse once per context
+                    first_page = pages_in_context == 0
+                    pages_in_context += 1
+                    challenged = process_article(
+                        url_data,
+                        page,
+                        worker_idx,
+                        with_login,
+                        stealth,
+                        move_mouse=first_page,
+                    )
+                    backoff = record_challenge_result(challenged)
+                    if challenged:
+                        log_message(
+                            f"All workers backing off for {backoff:.0f}s", "warning"
                         )
-                finally:
-                    try:
-                        browser.close()
-                    except Exception as e:
-                        log_message(f"Error closing browser: {str(e)}", "error")
 
-            task_queue.task_done()
-            log_message(f"Completed task for URL ID {url_data[0]}", "debug")
+                    log_message(f"Completed task for URL ID {url_data[0]}", "debug")
 
+                except Exception as e:
+                    if not shutdown.is_set():  # Only log if not shutting down
+                        log_message(f"Worker thread error: {str(e)}", "error")
+                        log_message(f"Stack trace: {repr(e)}", "debug")
         except Exception as e:
-            if not shutdown.is_set():  # Only log if not shutting down
-                log_message(f"Worker thread error: {str(e)}", "error")
-                log_message(f"Stack trace: {repr(e)}", "debug")
+            log_message(f"Worker failed to start browser: {str(e)}", "error")
+        finally:
+            flush_url_status_buffer()
+            try:
+                if context:
+                    context.close()
+                if browser:
+                    browser.close()
+            except Exception as e:
+                log_message(f"Error closing browser: {str(e)}", "error")
+
+
+def put_task(task_queue: Queue, task: Any, shutdown: Event) -> bool:
+    """
+    Put a task on the bounded queue, giving up once shutdown is requested.
+    Args:
+        task_queue (Queue): The bounded task queue.
+        task (Any): The task to enqueue.
+        shutdown (Event): Event to signal graceful shutdown.
+    Returns:
+        bool: True if the task was enqueued.
+    """
+    while not shutdown.is_set():
+        try:
+            task_queue.put(task, timeout=1)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def produce_tasks(
+    task_queue: Queue,
+    fetch_urls: Callable[[Session], Iterator[Tuple[int, str]]],
+    session_factory: callable,
+    workers: int,
+    shutdown: Event,
+) -> None:
+    """
+    Stream URLs from the database into the task queue, followed by one None
+    sentinel per worker.
+    Args:
+        task_queue (Queue): The bounded task queue.
+        fetch_urls (Callable): Returns the URL iterator for a session.
+        session_factory (callable): Function to create a session instance.
+        workers (int): Number of worker threads.
+        shutdown (Event): Event to signal graceful shutdown.
+    """
+    global queued_tasks
+
+    try:
+        with session_factory() as session:
+            for i, url in enumerate(fetch_urls(session)):
+                if not put_task(task_queue, ((url[0], url[1]), i % workers), shutdown):
+                    return
+                queued_tasks += 1
+    except Exception as e:
+        log_message(f"Error fetching URLs: {str(e)}", "error")
+    finally:
+        # Stop the workers once they have drained the queue
+        for _ in range(workers):
+            if not put_task(task_queue, None, shutdown):
+                break
+        ScopedSession.remove()
 
 
 def main(
@@ -297,6 +662,9 @@ def main(
     use_wandb: bool = False,
     log_level: str = "info",
     retry_failed: bool = False,
+    stealth: bool = False,
+    wandb_offline: bool = False,
+    shared_browser: bool = False,
 ) -> None:
     """Main execution function for processing URLs with worker threads.
 
@@ -307,8 +675,13 @@ def main(
         with_login: Whether to login to Medium. Requires a login_state.json. Turning this on will scrape ONLY premium articles.
         use_wandb: Whether to use wandb for logging metrics
         log_level: Log verbosity level (error, warning, success, info, debug)
+        retry_failed: Whether to retry previously failed URLs instead of new ones
+        stealth: Whether to pause around mouse movements to look more human
+        wandb_offline: Whether to log wandb runs locally and upload them later with `wandb sync`
+        shared_browser: Whether all workers connect to one Chromium over CDP instead of launching their own
     """
-    global start_time, shutdown_event, completed_tasks
+    global start_time, shutdown_event, queued_tasks
+    global completed_tasks, new_free_articles, new_premium_articles
 
     # Set the log level and log the status
     log_status = set_log_level(log_level)
@@ -326,6 +699,7 @@ def main(
             )
 
     # Initialize wandb if enabled
+    wandb_thread = None
     if use_wandb and WANDB_AVAILABLE:
         wandb.init(
             project="medium-scraper",
@@ -337,7 +711,16 @@ def main(
                 "url_count": url_count,
                 "with_login": with_login,
             },
+            # Offline runs write to disk only, so logging never waits on the network
+            mode="offline" if wandb_offline else None,
         )
+        wandb_thread = Thread(target=wandb_logger, daemon=True)
+        wandb_thread.start()
+        if wandb_offline:
+            log_message(
+                "Wandb is running offline. Upload the run later with: wandb sync",
+                "info",
+            )
     elif use_wandb and not WANDB_AVAILABLE:
         log_message(
             "Wandb requested but not available. Install with: pip install wandb",
@@ -348,26 +731,58 @@ def main(
     setup_signal_handlers(shutdown_event)
 
     start_time = time.time()
-    task_queue = Queue()
+    task_queue = Queue(maxsize=workers * TASKS_PER_WORKER)
     threads = []
+    status_writer = None
+    status_writer_stop = Event()
+    writer = None
+    writer_stop = Event()
+    shared_playwright = None
+    shared_browser_instance = None
 
     # Reset completed tasks counter
-    completed_tasks = 0
+    completed_tasks = new_free_articles = new_premium_articles = 0
+    queued_tasks = 0
 
     try:
-        # Initialize database session factory
-        session_factory = SessionLocal
-
-        # Fetch URLs with proper session management
-        with session_factory() as session:
-            if retry_failed:
-                url_data = fetch_failed_urls(session, url_count, with_login)
-            else:
-                url_data = fetch_random_urls(session, url_count, with_login)
+        # Database threads each get their own session and remove it when they stop
+        session_factory = ScopedSession
+
+        refresh_article_counts()
+
+        # Either every worker launches its own browser, or main launches one
+        # that the workers reach over CDP from their own Playwright instance.
+        # The port is picked per run, so runs and other Chrome instances never
+        # meet on a well-known debugging port.
+        if shared_browser:
+            cdp_port = find_free_port()
+            shared_playwright = sync_playwright().start()
+            shared_browser_instance = create_browser(
+                shared_playwright, headless, cdp_port
+            )
+            browser_factory = lambda p: connect_shared_browser(p, cdp_port)
+            log_message(f"Sharing one browser on CDP port {cdp_port}", "info")
+        else:
+            browser_factory = lambda p: create_browser(p, headless)
+
+        # A single thread writes the URL statuses in batches
+        status_writer = Thread(
+            target=url_status_writer,
+            args=(session_factory, status_writer_stop),
+            daemon=True,
+        )
+        status_writer.start()
 
-        total_urls = len(url_data)
+        # A single thread stores the scraped articles as they arrive
+        writer = Thread(
+            target=article_writer,
+            args=(session_factory, writer_stop),
+            daemon=True,
+        )
+        writer.start()
         log_message(
-            f"Starting to process {total_urls} URLs with {workers} workers", "info"
+            f"Starting to process {url_count or 'all'} URLs with {workers} workers",
+            "info",
         )
 
         # Create the progress display
@@ -381,76 +796,126 @@ def main(
             expand=True,
         )
 
-        # Create the overall task
+        # Create the overall task. The total is corrected once all URLs are queued.
         overall_task_id = progress.add_task(
-            "[white]Processing Articles", total=total_urls, completed=0, speed=0.0
+            "[white]Processing Articles", total=url_count, completed=0, speed=0.0
         )
 
         # Create a layout that combines progress and logs
         class DashboardLayout:
+            def __init__(self) -> None:
+                self.progress_panel = Panel(
+                    progress, title="Progress", border_style="blue"
+                )
+                self.metrics_key = None
+                self.metrics_panel = None
+
             def __rich_console__(
                 self, console: Console, options: ConsoleOptions
             ) -> RenderResult:
-                progress_panel = Panel(progress, title="Progress", border_style="blue")
                 log_panel = create_log_panel()
-                metrics_panel = create_metrics_display(get_current_metrics())
-                yield Group(progress_panel, metrics_panel, log_panel)
+
+                # Only rebuild the metrics panel when a displayed value can change
+                metrics = get_current_metrics()
+                metrics_key = (
+                    metrics.articles_processed,
+                    round(metrics.elapsed_minutes, 1),
+                )
+                if metrics_key != self.metrics_key:
+                    self.metrics_key = metrics_key
+                    self.metrics_panel = create_metrics_display(metrics)
+
+                yield Group(self.progress_panel, self.metrics_panel, log_panel)
 
         # Start the dashboard display in a Live context
-        with Live(DashboardLayout(), refresh_per_second=4, console=console):
+        with Live(DashboardLayout(), refresh_per_second=1, console=console):
             # Start worker threads
             for i in range(workers):
                 thread = Thread(
                     target=worker_thread,
                     args=(
                         task_queue,
-                        lambda p: create_browser(p, headless),
-                        session_factory,
+                        browser_factory,
                         shutdown_event,
                         with_login,
+                        stealth,
                     ),
                     daemon=True,
                 )
                 threads.append(thread)
                 thread.start()
 
-            # Enqueue tasks
-            for i, url in enumerate(url_data):
-                task_queue.put(((url[0], url[1]), i % workers))
-
-            # Add termination signals after all tasks
-            for _ in range(workers):
-                task_queue.put(None)
+            # Stream URLs to the workers as they arrive from the database
+            if retry_failed:
+                fetch_urls = lambda session: fetch_failed_urls(
+                    session, url_count, with_login
+                )
+            else:
+                fetch_urls = lambda session: fetch_random_urls(
+                    session, url_count, with_login
+                )
+            producer = Thread(
+                target=produce_tasks,
+                args=(task_queue, fetch_urls, session_factory, workers, shutdown_event),
+                daemon=True,
+            )
+            producer.start()
 
             # Monitor task completion
-            last_count = 0
-            while (
-                any(thread.is_alive() for thread in threads)
-                and not shutdown_event.is_set()
+            total_known = False
+            last_wandb_log = 0.0
+            last_progress_count = -1
+            last_progress_update = 0.0
+            while not shutdown_event.is_set() and any(
+                thread.is_alive() for thread in threads
             ):
-                time.sleep(0.25)
-
-                # Update progress display
-                with metrics_lock:
-                    current_count = completed_tasks
-                    elapsed = time.time() - start_time
-
-                speed = current_count / (elapsed / 60) if elapsed > 0 else 0
-
-                progress.update(overall_task_id, completed=current_count, speed=speed)
-
-                # Update wandb if enabled
-                if use_wandb and WANDB_AVAILABLE and current_count != last_count:
-                    metrics = get_current_metrics()
-                    wandb.log(metrics)
-                    last_count = current_count
+                shutdown_event.wait(timeout=MONITOR_INTERVAL_SECONDS)
+
+                # Fix the progress total once every URL has been queued
+                if not total_known and not producer.is_alive():
+                    progress.update(overall_task_id, total=queued_tasks)
+                    log_message(f"Queued {queued_tasks} URLs", "info")
+                    total_known = True
+
+                # Update progress display, coalescing updates that change nothing
+                now = time.time()
+                current_count = completed_tasks
+                if (
+                    current_count != last_progress_count
+                    or now - last_progress_update > PROGRESS_UPDATE_SECONDS
+                ):
+                    elapsed = now - start_time
+                    speed = current_count / (elapsed / 60) if elapsed > 0 else 0
+                    progress.update(
+                        overall_task_id, completed=current_count, speed=speed
+                    )
+                    last_progress_count = current_count
+                    last_progress_update = now
+
+                # Re-baseline the article counts on a slow cadence
+                if now - article_counts_refreshed_at > ARTICLE_COUNTS_REFRESH_SECONDS:
+                    refresh_article_counts()
+
+                # Update wandb if enabled, from in-memory metrics only
+                if (
+                    use_wandb
+                    and WANDB_AVAILABLE
+                    and now - last_wandb_log > WANDB_LOG_INTERVAL_SECONDS
+                ):
+                    try:
+                        wandb_queue.put_nowait(get_current_metrics())
+                    except Full:
+                        log_message(
+                            "Wandb is falling behind, dropping metrics", "debug"
+                        )
+                    last_wandb_log = now
 
             if shutdown_event.is_set():
                 log_message("Shutting down gracefully...", "warning")
 
     except Exception as e:
         log_message(f"Unhandled error: {str(e)}", "error")
-        console.print_exception(show_locals=True)
+        console.print_exception()
         raise
 
     finally:
@@ -458,17 +923,44 @@ def main(
         if not shutdown_event.is_set():
             shutdown_event.set()
 
-        # Cleanup threads
+        # Wake workers that are still blocked on an empty queue, then clean up.
+        # A full queue means no worker is waiting on it.
+        for _ in threads:
+            try:
+                task_queue.put_nowait(None)
+            except Full:
+                break
         for thread in threads:
             thread.join(timeout=5)
 
+        # Close the shared browser before stopping its Playwright driver
+        if shared_browser_instance:
+            try:
+                shared_browser_instance.close()
+            except Exception as e:
+                log_message(f"Error closing shared browser: {str(e)}", "error")
+        if shared_playwright:
+            shared_playwright.stop()
+
+        # Store the articles the workers scraped before they stopped
+        writer_stop.set()
+        if writer:
+            writer.join(timeout=30)
+
+        # Flush the remaining URL statuses
+        status_writer_stop.set()
+        if status_writer:
+            status_writer.join(timeout=10)
+
         # Final metrics
-        metrics = get_current_metrics()
+        metrics = get_current_metrics(refresh_counts=True)
         console.print("\n[bold green]Final Metrics:[/]")
         console.print(create_metrics_display(metrics))
 
-        if use_wandb and WANDB_AVAILABLE:
-            wandb.log(metrics)
+        if wandb_thread:
+            wandb_queue.put(None)
+            wandb_thread.join(timeout=10)
+            wandb.log(asdict(metrics))
             wandb.finish()
 
 
@@ -493,11 +985,26 @@ if __name__ == "__main__":
         action="store_true",
         help="Retry URLs that previously failed instead of new ones",
     )
+    parser.add_argument(
+        "--stealth",
+        action="store_true",
+        help="Pause around mouse movements to look more human (slower)",
+    )
+    parser.add_argument(
+        "--shared_browser",
+        action="store_true",
+        help="Run one browser that all workers connect to over CDP",
+    )
     parser.add_argument(
         "--use_wandb",
         action="store_true",
         help="Use Weights & Biases for logging metrics",
     )
+    parser.add_argument(
+        "--wandb_offline",
+        action="store_true",
+        help="Log wandb metrics locally and upload them later with `wandb sync`",
+    )
     parser.add_argument(
         "--log_level",
         type=str,
@@ -516,4 +1023,7 @@ if __name__ == "__main__":
         use_wandb=args.use_wandb,
         log_level=args.log_level,
         retry_failed=args.retry_failed,
+        stealth=args.stealth,
+        wandb_offline=args.wandb_offline,
+        shared_browser=args.shared_browser,
     )
@@ -1,15 +1,32 @@
 # scraper.py
+import itertools
 import logging
 import random
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date
 
 import requests
+from requests.adapters import HTTPAdapter
+from sqlalchemy import insert, select
+from urllib3.util.retry import Retry
 
 from database.database import URL, Sitemap, get_session
 
 SITEMAP_URL = "https://medium.com/sitemap/sitemap.xml"
 HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; MediumScraper/1.0)"}
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+SITEMAP_URL_TAG = f"{SITEMAP_NS}url"
+URL_BATCH_SIZE = 1000
+SITEMAP_FETCH_WORKERS = 8
+MAX_PENDING_SITEMAPS = 2 * SITEMAP_FETCH_WORKERS
+UPDATE_FREQ_MAPPING = {
+    "always": 0,
+    "hourly": 1,
+    "daily": 2,
+    "monthly": 3,
+}
 
 # Configure logging
 logging.basicConfig(
@@ -24,56 +41,93 @@ def get_random_timeout(avg_timeout: int) -> float:
     return max(0.1, random.gauss(avg_timeout, avg_timeout / 2))
 
 
-def process_url_element(url_elem, ns, sitemap_id):
-    """Extract URL information from an XML element and create a URL object."""
-    url = url_elem.find("ns:loc", ns).text
+def create_http_session():
+    """
+    Create an HTTP session that keeps connections to medium.com alive and
+    retries rate-limited and failed requests with backoff.
+    """
+    http_session = requests.Session()
+    http_session.headers.update(HEADERS)
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=SITEMAP_FETCH_WORKERS, max_retries=retries
+    )
+    http_session.mount("https://", adapter)
+    return http_session
 
-    lastmod = url_elem.find("ns:lastmod", ns)
-    lastmod = lastmod.text if lastmod is not None else None
 
-    changefreq = url_elem.find("ns:changefreq", ns)
-    changefreq = changefreq.text if changefreq is not None else None
+def fetch_sitemap(http_session, sitemap_url, timeout_average):
+    """
+    Download a sitemap after a random politeness delay and parse it while the
+    body streams in. Returns the URL rows, or None if the download failed.
+    """
+    time.sleep(get_random_timeout(timeout_average))
 
-    update_freq_mapping = {
-        "always": 0,
-        "hourly": 1,
-        "daily": 2,
-        "monthly": 3,
-    }
-    changefreq = update_freq_mapping.get(changefreq, None)
+    try:
+        with http_session.get(sitemap_url, timeout=10, stream=True) as response:
+            if response.status_code != 200:
+                logging.warning(
+                    f"Failed to retrieve sitemap {sitemap_url}: {response.status_code}"
+                )
+                return None
+
+            # Let urllib3 decode the gzip body on the fly for the parser
+            response.raw.decode_content = True
+            return list(parse_sitemap_urls(response.raw))
+    except Exception as e:
+        logging.error(f"Error retrieving sitemap {sitemap_url}: {str(e)}")
+        return None
 
-    priority = url_elem.find("ns:priority", ns)
-    priority = float(priority.text) if priority is not None else None
 
-    return URL(
-        sitemap_id=sitemap_id,
-        url=url,
-        last_modified=lastmod,
-        change_freq=changefreq,
-        priority=priority,
-    )
+def parse_sitemap_urls(stream):
+    """
+    Stream the <url> elements of a sitemap and yield them as URL rows. The root
+    is cleared after every <url>, so parsed elements never pile up in the tree.
+    """
+    root = None
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if root is None:
+            root = elem
+        elif event == "end" and elem.tag == SITEMAP_URL_TAG:
+            yield process_url_element(elem)
+            root.clear()
+
+
+def process_url_element(url_elem):
+    """Extract URL information from an XML element as a row for the URL table."""
+    # One pass over the children instead of a find() per field
+    fields = {child.tag[len(SITEMAP_NS) :]: child.text for child in url_elem}
+    lastmod = fields.get("lastmod")
+    priority = fields.get("priority")
+
+    return {
+        "url": fields["loc"],
+        # Parsed once here, so the driver never casts a string to a date
+        "last_modified": date.fromisoformat(lastmod[:10]) if lastmod else None,
+        "change_freq": UPDATE_FREQ_MAPPING.get(fields.get("changefreq")),
+        "priority": float(priority) if priority is not None else None,
+    }
 
 
-def process_sitemap_content(sitemap_url, content, session, ns):
-    """Process the content of a sitemap and store URLs in the database."""
+def process_sitemap_content(sitemap_url, url_rows, session):
+    """Store a parsed sitemap and its URLs in the database."""
     try:
-        root = ET.fromstring(content)
-        urls = root.findall("ns:url", ns)
-
         # Create sitemap entry
-        sitemap = Sitemap(sitemap_url=sitemap_url, articles_count=len(urls))
+        sitemap = Sitemap(sitemap_url=sitemap_url, articles_count=len(url_rows))
         session.add(sitemap)
         session.flush()
-        logging.info(f"Processing sitemap: {sitemap_url} with {len(urls)} URLs")
+        logging.info(f"Processing sitemap: {sitemap_url} with {len(url_rows)} URLs")
 
-        # Process URLs in batches for better performance
-        batch_size = 100
-        for i in range(0, len(urls), batch_size):
-            batch = urls[i : i + batch_size]
-            url_entries = [
-                process_url_element(url_elem, ns, sitemap.id) for url_elem in batch
-            ]
-            session.bulk_save_objects(url_entries)
+        for row in url_rows:
+            row["sitemap_id"] = sitemap.id
+
+        # Insert URLs in batches for better performance
+        for i in range(0, len(url_rows), URL_BATCH_SIZE):
+            session.execute(insert(URL.__table__), url_rows[i : i + URL_BATCH_SIZE])
 
         session.commit()
         logging.info(f"Successfully processed sitemap: {sitemap_url}")
@@ -100,48 +154,63 @@ def retrieve_sitemaps(timeout_average: int) -> bool:
             logging.info(f"Master sitemap {SITEMAP_URL} already processed")
             return True
 
+        # One pooled HTTP session for the master sitemap and all sub-sitemaps
+        http_session = create_http_session()
+
         # Retrieve the master sitemap
-        response = requests.get(SITEMAP_URL, headers=HEADERS, timeout=10)
+        response = http_session.get(SITEMAP_URL, timeout=10)
         if response.status_code != 200:
             logging.error(f"Failed to retrieve master sitemap: {response.status_code}")
             return False
 
-        content = response.text
-        root = ET.fromstring(content)
-        ns = {"ns": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+        root = ET.fromstring(response.content)
         sitemap_urls = [
-            elem.find("ns:loc", ns).text for elem in root.findall("ns:sitemap", ns)
+            elem.findtext(f"{SITEMAP_NS}loc")
+            for elem in root.iter(f"{SITEMAP_NS}sitemap")
         ]
 
         logging.info(f"Found {len(sitemap_urls)} sitemaps")
 
-        for sitemap_url in sitemap_urls:
-            # Check if this sitemap was already processed
-            existing_sitemap = (
-                session.query(Sitemap)
-                .filter(Sitemap.sitemap_url == sitemap_url)
-                .first()
+        # Look up all already processed sitemaps in a single query
+        processed = set(
+            session.scalars(
+                select(Sitemap.sitemap_url).where(Sitemap.sitemap_url.in_(sitemap_urls))
             )
+        )
 
-            if existing_sitemap:
+        new_sitemap_urls = []
+        for sitemap_url in sitemap_urls:
+            if sitemap_url in processed:
                 logging.info(f"Sitemap {sitemap_url} already processed, skipping")
                 continue
 
-            time.sleep(get_random_timeout(timeout_average))
-
-            try:
-                response = requests.get(sitemap_url, headers=HEADERS, timeout=10)
-                if response.status_code != 200:
-                    logging.warning(
-                        f"Failed to retrieve sitemap {sitemap_url}: {response.status_code}"
+            new_sitemap_urls.append(sitemap_url)
+
+        # Download the sitemaps in parallel, but store them from this thread
+        # only, since the session must not be shared between threads. At most
+        # MAX_PENDING_SITEMAPS are downloading or waiting to be stored, so the
+        # parsed rows in memory stay bounded when the database falls behind.
+        with ThreadPoolExecutor(max_workers=SITEMAP_FETCH_WORKERS) as executor:
+            remaining = iter(new_sitemap_urls)
+            pending = {}
+            while True:
+                for sitemap_url in itertools.islice(
+                    remaining, MAX_PENDING_SITEMAPS - len(pending)
+                ):
+                    future = executor.submit(
+                        fetch_sitemap, http_session, sitemap_url, timeout_average
                     )
-                    continue
+                    pending[future] = sitemap_url
 
-                process_sitemap_content(sitemap_url, response.text, session, ns)
+                if not pending:
+                    break
 
-            except Exception as e:
-                logging.error(f"Error retrieving sitemap {sitemap_url}: {str(e)}")
-                continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    sitemap_url = pending.pop(future)
+                    url_rows = future.result()
+                    if url_rows is not None:
+                        process_sitemap_content(sitemap_url, url_rows, session)
 
         return True
 